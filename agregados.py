@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+"""Agregados multirresolución de los sensores para el dashboard
+
+En lugar de devolver las últimas 1000 lecturas crudas en cada consulta, este
+trabajo mantiene por variable el conteo, la suma, el mínimo y el máximo en
+intervalos de 10 minutos, 1 hora y 1 día, y los exporta como archivos pequeños
+por resolución. La actualización es incremental: solo se leen de la fuente las
+lecturas posteriores a la última procesada y solo se recalculan los intervalos
+que tocan. Cada resolución conserva un número fijo de intervalos, así que el
+tamaño de los archivos no crece con la tabla.
+
+``index.json`` lista el ETag (hash del contenido) y la fecha de última
+modificación de cada archivo: el cliente consulta ese índice y descarga solo las
+resoluciones que cambiaron. Los archivos sin cambios no se reescriben.
+
+Uso:
+    python agregados.py [fuente] [carpeta]
+
+``fuente`` admite lo mismo que SARIMA_FUENTE_DATOS (URL SQL, volcado .json o
+CSV); por defecto ``datos/datos_sensores.json``.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from fuentes_datos import COLUMNAS_SENSOR, crear_fuente
+
+RUTA_AGREGADOS = "datos/agregados"
+FUENTE_AGREGADOS = "datos/datos_sensores.json"
+
+# Resolución -> (frecuencia de pandas, intervalos que se conservan)
+RESOLUCIONES = {
+    "10min": ("10min", 7 * 144),   # 7 días
+    "1h": ("h", 30 * 24),          # 30 días
+    "1d": ("D", 730),              # 2 años
+}
+
+VARIABLES_AGREGADOS = list(COLUMNAS_SENSOR.values())
+DECIMALES_AGREGADOS = int(os.environ.get("SARIMA_DECIMALES_AGREGADOS", 2))
+FORMATO_FECHA = "%Y-%m-%d %H:%M:%S"
+
+
+def _vacio(k):
+    """Estado sin intervalos para ``k`` variables"""
+    return {
+        "inicio": np.empty(0, dtype=np.int64),
+        "n": np.empty((0, k), dtype=np.int64),
+        "suma": np.empty((0, k)),
+        "min": np.empty((0, k)),
+        "max": np.empty((0, k)),
+    }
+
+
+def agregar_lecturas(df, frecuencia, variables=VARIABLES_AGREGADOS):
+    """Conteo, suma, mínimo y máximo por intervalo de las lecturas ``df`` (vectorizado)"""
+    k = len(variables)
+    if len(df) == 0:
+        return _vacio(k)
+    valores = df.reindex(columns=variables).to_numpy(dtype=np.float64)
+    inicio = df.index.floor(frecuencia).as_unit("ns").asi8
+    intervalos, grupo = np.unique(inicio, return_inverse=True)
+
+    m = len(intervalos)
+    presentes = ~np.isnan(valores)
+    n = np.zeros((m, k), dtype=np.int64)
+    suma = np.zeros((m, k))
+    minimo = np.full((m, k), np.inf)
+    maximo = np.full((m, k), -np.inf)
+    np.add.at(n, grupo, presentes)
+    np.add.at(suma, grupo, np.where(presentes, valores, 0.0))
+    np.fmin.at(minimo, grupo, valores)
+    np.fmax.at(maximo, grupo, valores)
+    return {"inicio": intervalos, "n": n, "suma": suma, "min": minimo, "max": maximo}
+
+
+def combinar(estado, nuevos, capacidad):
+    """Fusiona los intervalos ``nuevos`` con ``estado`` y conserva los ``capacidad`` últimos
+
+    Los intervalos repetidos (el abierto al final del estado, o lecturas que
+    llegan tarde) se combinan sumando conteos y sumas y tomando mín./máx.
+    """
+    if len(nuevos["inicio"]) == 0:
+        return estado
+    unidos = {c: np.concatenate([estado[c], nuevos[c]]) for c in estado}
+    intervalos, grupo = np.unique(unidos["inicio"], return_inverse=True)
+    if len(intervalos) < len(unidos["inicio"]):
+        forma = (len(intervalos), unidos["n"].shape[1])
+        combinado = {
+            "inicio": intervalos,
+            "n": np.zeros(forma, dtype=np.int64),
+            "suma": np.zeros(forma),
+            "min": np.full(forma, np.inf),
+            "max": np.full(forma, -np.inf),
+        }
+        np.add.at(combinado["n"], grupo, unidos["n"])
+        np.add.at(combinado["suma"], grupo, unidos["suma"])
+        np.fmin.at(combinado["min"], grupo, unidos["min"])
+        np.fmax.at(combinado["max"], grupo, unidos["max"])
+    else:
+        orden = np.argsort(unidos["inicio"], kind="stable")
+        combinado = {c: v[orden] for c, v in unidos.items()}
+    return {c: v[-capacidad:] for c, v in combinado.items()}
+
+
+class AgregadosMultiresolucion:
+    """Agregados por resolución persistidos en ``estado.npz`` dentro de ``carpeta``
+
+    ``ultima_fecha`` es la marca de la última lectura procesada: la siguiente
+    actualización pide a la fuente solo lo posterior.
+    """
+
+    def __init__(self, carpeta=RUTA_AGREGADOS, variables=VARIABLES_AGREGADOS,
+                 resoluciones=RESOLUCIONES):
+        self.carpeta = carpeta
+        self.variables = list(variables)
+        self.resoluciones = dict(resoluciones)
+        self.ruta_estado = os.path.join(carpeta, "estado.npz")
+        self.ruta_indice = os.path.join(carpeta, "index.json")
+        self.ultima_fecha = None
+        self.estados = {r: _vacio(len(self.variables)) for r in self.resoluciones}
+        self._cargar()
+
+    def _cargar(self):
+        if not os.path.exists(self.ruta_estado):
+            return
+        try:
+            with np.load(self.ruta_estado, allow_pickle=False) as datos:
+                if list(datos["variables"]) != self.variables:
+                    print("⚠️  Las variables de los agregados cambiaron; se recalculan")
+                    return
+                ultima = int(datos["ultima_fecha"])
+                for r in self.resoluciones:
+                    if f"{r}|inicio" in datos:
+                        self.estados[r] = {c: datos[f"{r}|{c}"] for c in self.estados[r]}
+        except Exception as e:
+            print(f"⚠️  Estado de agregados ilegible ({e}); se recalculan")
+            self.estados = {r: _vacio(len(self.variables)) for r in self.resoluciones}
+            return
+        self.ultima_fecha = pd.Timestamp(ultima) if ultima >= 0 else None
+
+    def guardar(self):
+        """Escribe el estado de forma atómica"""
+        os.makedirs(self.carpeta, exist_ok=True)
+        arreglos = {
+            f"{r}|{c}": v for r, estado in self.estados.items() for c, v in estado.items()
+        }
+        ultima = -1 if self.ultima_fecha is None else self.ultima_fecha.as_unit("ns").value
+        temporal = self.ruta_estado + ".tmp.npz"
+        np.savez(
+            temporal, variables=np.array(self.variables), ultima_fecha=np.int64(ultima), **arreglos
+        )
+        os.replace(temporal, self.ruta_estado)
+
+    def actualizar(self, df):
+        """Incorpora las lecturas ``df`` posteriores a ``ultima_fecha``; devuelve cuántas entraron"""
+        df = df[df.index.notnull()].sort_index()
+        if self.ultima_fecha is not None:
+            df = df[df.index > self.ultima_fecha]
+        if len(df) == 0:
+            return 0
+        for r, (frecuencia, capacidad) in self.resoluciones.items():
+            nuevos = agregar_lecturas(df, frecuencia, self.variables)
+            self.estados[r] = combinar(self.estados[r], nuevos, capacidad)
+        self.ultima_fecha = df.index[-1]
+        return len(df)
+
+    def sincronizar(self, fuente):
+        """Lee de la fuente solo las lecturas nuevas y las agrega"""
+        return self.actualizar(fuente.leer(desde=self.ultima_fecha))
+
+    def tabla(self, resolucion):
+        """Agregados de una resolución como listas: fechas, n, media, mín. y máx. por variable"""
+        estado = self.estados[resolucion]
+        vacio = estado["n"] == 0
+        with np.errstate(invalid="ignore", divide="ignore"):
+            media = np.where(vacio, np.nan, estado["suma"] / estado["n"])
+        minimo = np.where(vacio, np.nan, estado["min"])
+        maximo = np.where(vacio, np.nan, estado["max"])
+
+        def lista(columna):
+            redondeada = np.round(columna, DECIMALES_AGREGADOS).astype(object)
+            redondeada[np.isnan(columna)] = None
+            return redondeada.tolist()
+
+        fechas = pd.DatetimeIndex(estado["inicio"].view("datetime64[ns]"))
+        return {
+            "resolucion": resolucion,
+            "fechas": fechas.strftime(FORMATO_FECHA).tolist(),
+            "variables": {
+                var: {
+                    "n": estado["n"][:, j].tolist(),
+                    "media": lista(media[:, j]),
+                    "min": lista(minimo[:, j]),
+                    "max": lista(maximo[:, j]),
+                }
+                for j, var in enumerate(self.variables)
+            },
+        }
+
+    def _leer_indice(self):
+        if not os.path.exists(self.ruta_indice):
+            return {}
+        with open(self.ruta_indice, "r", encoding="utf-8") as f:
+            return json.load(f).get("resoluciones", {})
+
+    def exportar(self):
+        """Escribe ``<resolucion>.json`` solo si cambió y el índice con ETag y fecha
+
+        Devuelve la lista de archivos reescritos.
+        """
+        os.makedirs(self.carpeta, exist_ok=True)
+        anterior = self._leer_indice()
+        ahora = time.strftime(FORMATO_FECHA)
+        resoluciones = {}
+        escritos = []
+        for r in self.resoluciones:
+            contenido = json.dumps(
+                self.tabla(r), ensure_ascii=False, separators=(",", ":")
+            ).encode("utf-8")
+            etag = hashlib.sha256(contenido).hexdigest()[:16]
+            nombre = f"{r}.json"
+            ruta = os.path.join(self.carpeta, nombre)
+            previo = anterior.get(r, {})
+            if previo.get("etag") == etag and os.path.exists(ruta):
+                resoluciones[r] = previo
+                continue
+            temporal = ruta + ".tmp"
+            with open(temporal, "wb") as f:
+                f.write(contenido)
+            os.replace(temporal, ruta)
+            escritos.append(nombre)
+            resoluciones[r] = {
+                "archivo": nombre,
+                "etag": etag,
+                "ultima_modificacion": ahora,
+                "intervalos": int(len(self.estados[r]["inicio"])),
+                "bytes": len(contenido),
+            }
+
+        if escritos or not os.path.exists(self.ruta_indice):
+            indice = {
+                "ultima_lectura": (
+                    None if self.ultima_fecha is None else self.ultima_fecha.strftime(FORMATO_FECHA)
+                ),
+                "resoluciones": resoluciones,
+            }
+            with open(self.ruta_indice, "w", encoding="utf-8") as f:
+                json.dump(indice, f, indent=2, ensure_ascii=False)
+        return escritos
+
+
+def respuesta_condicional(carpeta, resolucion, si_no_coincide=None):
+    """(código, cuerpo, etag) para servir una resolución respetando If-None-Match
+
+    Devuelve 304 sin cuerpo si el ETag del cliente coincide con el del índice.
+    """
+    ruta_indice = os.path.join(carpeta, "index.json")
+    if not os.path.exists(ruta_indice):
+        return 404, None, None
+    with open(ruta_indice, "r", encoding="utf-8") as f:
+        entrada = json.load(f).get("resoluciones", {}).get(resolucion)
+    if entrada is None:
+        return 404, None, None
+    etag = f'"{entrada["etag"]}"'
+    if si_no_coincide and etag in [e.strip() for e in si_no_coincide.split(",")]:
+        return 304, None, etag
+    with open(os.path.join(carpeta, entrada["archivo"]), "rb") as f:
+        return 200, f.read(), etag
+
+
+def main(fuente=FUENTE_AGREGADOS, carpeta=RUTA_AGREGADOS):
+    from modelo_sarima import parse_datetime_index
+
+    agregados = AgregadosMultiresolucion(carpeta)
+    nuevas = agregados.sincronizar(crear_fuente(fuente, parse_datetime_index))
+    agregados.guardar()
+    escritos = agregados.exportar()
+    print(f"📊 {nuevas} lecturas nuevas; archivos actualizados: {', '.join(escritos) or 'ninguno'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*sys.argv[1:3]))
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""Benchmark de las etapas del pronóstico con datos sintéticos (sin red)
+
+Uso:
+    python benchmarks/bench_pipeline.py [--guardar] [--tamanos N ...] [--trabajadores W ...]
+
+Mide el preprocesamiento, un ajuste SARIMA, la búsqueda de órdenes completa y
+la exportación a JSON con series de 500 a 50,000 horas generadas con
+``generar_datos_ejemplo`` (el mismo respaldo de ``cargar_datos_google_sheets``).
+La búsqueda se mide con cada número de procesos de ``--trabajadores``.
+
+Con ``--guardar`` los tiempos quedan como línea base en
+``benchmarks/linea_base.json``; sin él se comparan contra esa línea base y el
+script termina con código 1 si alguna etapa es más lenta que ``--umbral`` veces
+su tiempo de referencia (las diferencias menores a ``--tolerancia`` segundos se
+consideran ruido). La línea base depende de la máquina: conviene generarla en
+la misma donde se compara.
+
+Sin línea base el script termina con código 2: una comparación que no se pudo
+hacer no cuenta como aprobada. En CI lo corre ``.github/workflows/benchmark.yml``,
+que guarda la línea base del runner en la caché de Actions, la genera con
+``--guardar`` solo la primera vez (o al pedirlo a mano) y en adelante compara.
+Localmente:
+
+    python benchmarks/bench_pipeline.py --guardar   # en la rama de referencia
+    python benchmarks/bench_pipeline.py             # con los cambios; 1 = regresión
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import modelo_sarima as ms  # noqa: E402
+
+RUTA_LINEA_BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "linea_base.json")
+
+# Series largas: el ajuste y la búsqueda crecen mucho más rápido que el resto
+TAMANOS = [500, 2_000, 10_000, 50_000]
+MAX_FILAS_AJUSTE = 10_000
+MAX_FILAS_BUSQUEDA = 2_000
+
+# Orden del ajuste individual y de la exportación (el más completo de la rejilla)
+ORDEN = (1, 0, 1)
+ORDEN_ESTACIONAL = (1, 0, 1, ms.PERIODO_ESTACIONAL)
+VARIABLE = "Temperature"
+
+
+def cronometrar(funcion, repeticiones):
+    """Mejor tiempo de ``repeticiones`` llamadas a ``funcion`` y su último resultado"""
+    mejor = float("inf")
+    resultado = None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, resultado
+
+
+def serie_sintetica(filas):
+    """Datos crudos horarios reproducibles (con ciclo diario) y su serie preparada"""
+    df0 = ms.generar_datos_ejemplo(filas, fin="2026-01-01", semilla=0, ciclo_diario=1.0)
+    return df0, ms.preparar_datos_horarios(df0)[VARIABLE]
+
+
+def medir_etapas(tamanos, trabajadores, modo, repeticiones, max_ajuste, max_busqueda):
+    """Tiempos por ``etapa|filas|trabajadores`` en segundos"""
+    tiempos = {}
+
+    def registrar(etapa, filas, n_trabajadores, segundos):
+        clave = f"{etapa}|{filas}|{n_trabajadores}"
+        tiempos[clave] = round(segundos, 4)
+        print(f"{etapa:<22} {filas:>8,} {n_trabajadores:>5} {segundos:>12.4f}")
+
+    print(f"{'Etapa':<22} {'Filas':>8} {'Proc.':>5} {'Segundos':>12}")
+    params = None
+    for filas in tamanos:
+        df0, serie = serie_sintetica(filas)
+        t, _ = cronometrar(lambda: ms.preparar_datos_horarios(df0), repeticiones)
+        registrar("preprocesamiento", filas, 1, t)
+
+        if filas <= max_ajuste:
+            t, ajuste = cronometrar(
+                lambda: ms.crear_sarimax(serie, ORDEN, ORDEN_ESTACIONAL).fit(
+                    disp=False, maxiter=ms.MAXITER
+                ),
+                repeticiones,
+            )
+            registrar("ajuste", filas, 1, t)
+            if params is None:
+                params = ajuste.params
+
+        if filas <= max_busqueda:
+            for n_trabajadores in trabajadores:
+                t, _ = cronometrar(
+                    lambda: ms.buscar_mejores_modelos(
+                        {VARIABLE: serie}, n_trabajadores=n_trabajadores, modo=modo
+                    ),
+                    1,
+                )
+                registrar(f"busqueda_{modo}", filas, n_trabajadores, t)
+
+        # La exportación reutiliza los parámetros ya estimados (solo un filtrado)
+        if params is not None:
+            modelo = ms.crear_sarimax(serie, ORDEN, ORDEN_ESTACIONAL).smooth(params)
+            for formato in ("completo", "compacto"):
+                t, _ = cronometrar(
+                    lambda: ms.serializar_json(
+                        ms.exportar_pronosticos_json(
+                            modelo, serie, pasos=72, var_name=VARIABLE, formato=formato
+                        ),
+                        compacto=formato == "compacto",
+                    ),
+                    repeticiones,
+                )
+                registrar(f"exportacion_{formato}", filas, 1, t)
+    return tiempos
+
+
+def comparar(tiempos, linea_base, umbral, tolerancia):
+    """Etapas más lentas que ``umbral`` veces la línea base: [(clave, base, actual)]"""
+    regresiones = []
+    for clave, actual in tiempos.items():
+        base = linea_base.get(clave)
+        if base is None:
+            continue
+        if actual > base * umbral and actual - base > tolerancia:
+            regresiones.append((clave, base, actual))
+    return regresiones
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tamanos", type=int, nargs="+", default=TAMANOS)
+    parser.add_argument("--trabajadores", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    parser.add_argument("--modo", default=ms.MODO_BUSQUEDA, choices=["exhaustivo", "stepwise", "cribado"])
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--max-filas-ajuste", type=int, default=MAX_FILAS_AJUSTE)
+    parser.add_argument("--max-filas-busqueda", type=int, default=MAX_FILAS_BUSQUEDA)
+    parser.add_argument("--umbral", type=float, default=1.25)
+    parser.add_argument("--tolerancia", type=float, default=0.05)
+    parser.add_argument("--linea-base", default=RUTA_LINEA_BASE)
+    parser.add_argument("--guardar", action="store_true", help="guardar los tiempos como línea base")
+    args = parser.parse_args(argv)
+
+    tiempos = medir_etapas(
+        args.tamanos,
+        sorted(set(args.trabajadores)),
+        args.modo,
+        args.repeticiones,
+        args.max_filas_ajuste,
+        args.max_filas_busqueda,
+    )
+
+    if args.guardar:
+        with open(args.linea_base, "w", encoding="utf-8") as f:
+            json.dump({
+                "fecha": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "maquina": f"{platform.platform()} / {os.cpu_count()} CPU / Python {platform.python_version()}",
+                "tiempos": tiempos,
+            }, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 Línea base guardada en {args.linea_base}")
+        return 0
+
+    if not os.path.exists(args.linea_base):
+        print(f"\n❌ No hay línea base en {args.linea_base}; genérela con --guardar")
+        return 2
+    with open(args.linea_base, "r", encoding="utf-8") as f:
+        linea_base = json.load(f)
+
+    regresiones = comparar(tiempos, linea_base["tiempos"], args.umbral, args.tolerancia)
+    if not regresiones:
+        print(f"\n✅ Ninguna etapa supera {args.umbral:.2f}x la línea base ({linea_base['fecha']})")
+        return 0
+    print(f"\n❌ Etapas más lentas que {args.umbral:.2f}x la línea base ({linea_base['fecha']}):")
+    for clave, base, actual in regresiones:
+        etapa, filas, n_trabajadores = clave.split("|")
+        print(f"  {etapa} ({filas} filas, {n_trabajadores} proc.): {base:.4f}s → {actual:.4f}s ({actual / base:.2f}x)")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
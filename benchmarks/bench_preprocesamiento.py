@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""Benchmark del preprocesamiento: etapa fusionada vs. la cadena anterior
+
+Uso:
+    python benchmarks/bench_preprocesamiento.py [filas ...]
+
+Por defecto mide 10k, 100k y 1M filas crudas (lecturas cada 10 minutos con el
+formato de la hoja) y comprueba que ambas cadenas den exactamente el mismo
+resultado. La comparación se hace sin la limpieza de picos y huecos
+(SARIMA_LIMPIEZA), que cambia los valores a propósito; ``limpiar_series`` se
+mide aparte sobre la misma serie horaria.
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modelo_sarima import modelo as ms  # noqa: E402
+
+
+def generar_filas_crudas(n, semilla=0):
+    """Filas sintéticas con las columnas y el formato de fecha de Google Sheets"""
+    rng = np.random.default_rng(semilla)
+    fechas = pd.date_range(end="2026-01-01", periods=n, freq="10min")
+    df = pd.DataFrame({
+        "Date": fechas.strftime("%d/%m/%Y %H:%M:%S"),
+        "Temperature": rng.normal(25, 5, n),
+        "Humidity": rng.normal(60, 15, n),
+        "PM 1.0 (µg/m³)": rng.normal(10, 5, n),
+        "PM 2.5(µg/m³)": rng.normal(20, 10, n),
+        "PM 10 (µg/m³)": rng.normal(35, 15, n),
+        "Radiacion Solar (W/m)": rng.normal(300, 100, n),
+    })
+    # Huecos y valores inválidos como en los datos reales
+    for columna in ("Temperature", "PM 2.5(µg/m³)"):
+        df.loc[rng.random(n) < 0.02, columna] = np.nan
+    df["PM 10 (µg/m³)"] = df["PM 10 (µg/m³)"].astype(object)
+    df.loc[rng.random(n) < 0.001, "PM 10 (µg/m³)"] = "error"
+    return df.drop(index=df.index[rng.random(n) < 0.05])
+
+
+def preparar_cadena_anterior(df0):
+    """Cadena de preprocesamiento previa (copias y conversiones por columna)"""
+    df_copy = df0.copy()
+    df_copy.rename(
+        columns={
+            "Date": "date",
+            "PM 1.0 (µg/m³)": "PM 1",
+            "PM 2.5(µg/m³)": "PM 2.5",
+            "PM 10 (µg/m³)": "PM 10",
+            "Radiacion Solar (W/m)": "Radiacion Solar",
+        },
+        inplace=True,
+    )
+    for var in ["Temperature", "Humidity", "PM 2.5", "PM 10", "Radiacion Solar"]:
+        df_copy[var] = pd.to_numeric(df_copy[var], errors="coerce")
+    df_copy["date"] = pd.to_datetime(df_copy["date"], format="%d/%m/%Y %H:%M:%S", errors="coerce")
+    df_copy.set_index("date", inplace=True)
+    df1 = df_copy[df_copy.index.notnull()]
+    df1 = df1.resample("1h").mean()
+
+    df2 = df1.copy()
+    for var in ["Temperature", "Humidity", "PM 10", "PM 2.5", "Radiacion Solar"]:
+        means = df2.groupby(df2.index.time)[var].transform("mean")
+        df2[var] = df2[var].fillna(means)
+
+    df3 = df2.copy()
+    df3 = df3.drop(columns=["PM 1"], errors="ignore")
+    return df3.resample("h").mean().dropna()
+
+
+def medir(funcion, df, repeticiones=3):
+    """Mejor tiempo de ``repeticiones`` ejecuciones y el último resultado"""
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion(df)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, resultado
+
+
+def serie_horaria(df0):
+    """Serie horaria sin imputar: la entrada de ``limpiar_series``"""
+    df = ms.parse_datetime_index(df0)
+    return df[[c for c in df.columns if c in ms.VARIABLES]].resample("1h").mean()
+
+
+def main(tamanos):
+    # La cadena anterior no limpia: se compara contra la imputación simple
+    ms.LIMPIEZA = False
+    print(f"{'Filas':>10} {'Anterior (s)':>14} {'Fusionada (s)':>14} {'Aceleración':>12} {'Limpieza (s)':>14}")
+    for n in tamanos:
+        df = generar_filas_crudas(n)
+        repeticiones = 3 if n <= 100_000 else 1
+        t_anterior, esperado = medir(preparar_cadena_anterior, df, repeticiones)
+        t_nuevo, obtenido = medir(ms.preparar_datos_horarios, df, repeticiones)
+        pd.testing.assert_frame_equal(obtenido, esperado, check_freq=False)
+        t_limpieza, _ = medir(ms.limpiar_series, serie_horaria(df), repeticiones)
+        print(f"{n:>10,} {t_anterior:>14.3f} {t_nuevo:>14.3f} {t_anterior / t_nuevo:>11.1f}x {t_limpieza:>14.3f}")
+
+
+if __name__ == "__main__":
+    main([int(n) for n in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
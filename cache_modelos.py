@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""Caché en disco de modelos ajustados, direccionada por el contenido de la serie
+
+La clave de cada entrada es el SHA-256 de la serie horaria preprocesada (fechas
+y valores) junto con la configuración de la búsqueda: si el sensor no envió
+datos nuevos, la misma serie vuelve a dar la misma clave y se reutilizan el
+orden ganador, los parámetros y el pronóstico exportado sin volver a ajustar.
+
+Cada entrada es un registro liviano (órdenes, parámetros, estado persistido y
+JSON del pronóstico) guardado con pickle. El tamaño total se acota expulsando
+las entradas usadas hace más tiempo (la fecha de modificación del archivo hace
+de marca de último uso).
+"""
+
+import hashlib
+import json
+import os
+import pickle
+
+import numpy as np
+
+RUTA_CACHE = "datos/cache_modelos"
+MAX_MB_CACHE = float(os.environ.get("SARIMA_CACHE_MB", 50))
+
+# Se incrementa cuando cambia el contenido de las entradas
+VERSION_CACHE = 1
+
+
+def huella_serie(clave, serie, configuracion):
+    """Clave de caché de una serie: hash de su nombre, fechas, valores y configuración"""
+    h = hashlib.sha256()
+    h.update(json.dumps(
+        {"version": VERSION_CACHE, "serie": clave, "configuracion": configuracion},
+        sort_keys=True,
+        default=str,
+    ).encode("utf-8"))
+    h.update(np.ascontiguousarray(serie.index.as_unit("ns").asi8, dtype=np.int64).tobytes())
+    h.update(np.ascontiguousarray(serie.to_numpy(dtype=np.float64)).tobytes())
+    return h.hexdigest()
+
+
+class CacheModelos:
+    """Entradas ``<huella>.pkl`` en una carpeta, con expulsión LRU por tamaño"""
+
+    def __init__(self, carpeta=RUTA_CACHE, max_bytes=None):
+        self.carpeta = carpeta
+        self.max_bytes = int(MAX_MB_CACHE * 1024 * 1024) if max_bytes is None else max_bytes
+        self.aciertos = 0
+        self.fallos = 0
+
+    def _ruta(self, huella):
+        return os.path.join(self.carpeta, f"{huella}.pkl")
+
+    def obtener(self, huella):
+        """Entrada guardada con esa huella (None si no está o no se puede leer)"""
+        ruta = self._ruta(huella)
+        try:
+            with open(ruta, "rb") as f:
+                entrada = pickle.load(f)
+        except FileNotFoundError:
+            self.fallos += 1
+            return None
+        except Exception as e:
+            print(f"⚠️  Entrada de caché ilegible ({e}), se descarta")
+            os.remove(ruta)
+            self.fallos += 1
+            return None
+        os.utime(ruta)
+        self.aciertos += 1
+        return entrada
+
+    def guardar(self, huella, entrada):
+        """Guarda la entrada (escritura atómica) y expulsa las más antiguas si sobra tamaño"""
+        os.makedirs(self.carpeta, exist_ok=True)
+        ruta = self._ruta(huella)
+        temporal = ruta + ".tmp"
+        with open(temporal, "wb") as f:
+            pickle.dump(entrada, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporal, ruta)
+        self.expulsar(conservar=ruta)
+
+    def expulsar(self, conservar=None):
+        """Borra las entradas usadas hace más tiempo hasta quedar bajo ``max_bytes``"""
+        if not os.path.isdir(self.carpeta):
+            return 0
+        entradas = []
+        for nombre in os.listdir(self.carpeta):
+            if nombre.endswith(".pkl"):
+                ruta = os.path.join(self.carpeta, nombre)
+                estado = os.stat(ruta)
+                entradas.append((estado.st_mtime, estado.st_size, ruta))
+        total = sum(tamano for _, tamano, _ in entradas)
+        borradas = 0
+        for _, tamano, ruta in sorted(entradas):
+            if total <= self.max_bytes:
+                break
+            if ruta == conservar:
+                continue
+            os.remove(ruta)
+            total -= tamano
+            borradas += 1
+        return borradas
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""Almacén local del historial de sensores con descarga incremental"""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+# Columnas numéricas guardadas (nombres ya normalizados por parse_datetime_index)
+COLUMNAS_HISTORIAL = ["Temperature", "Humidity", "PM 1", "PM 2.5", "PM 10", "Radiacion Solar"]
+
+# Filas ya descargadas que se vuelven a pedir por seguridad (se deduplican por fecha)
+FILAS_SOLAPE = 5
+
+
+class HistorialSensores:
+    """Historial de lecturas en archivos binarios de ancho fijo, leídos con memmap
+
+    ``fechas.bin`` guarda las marcas de tiempo (int64, ns) y ``valores.bin`` una
+    matriz float64 fila a fila. ``meta.json`` registra cuántas filas son válidas,
+    así una escritura interrumpida no deja filas a medias: se sobrescriben en la
+    siguiente llamada a ``agregar``.
+    """
+
+    def __init__(self, carpeta, columnas=None):
+        self.carpeta = carpeta
+        self.ruta_fechas = os.path.join(carpeta, "fechas.bin")
+        self.ruta_valores = os.path.join(carpeta, "valores.bin")
+        self.ruta_meta = os.path.join(carpeta, "meta.json")
+        self.meta = {
+            "columnas": list(columnas or COLUMNAS_HISTORIAL),
+            "filas": 0,
+            "filas_fuente": 0,
+            "columnas_fuente": None,
+            "ultima_fecha": None,
+        }
+        if os.path.exists(self.ruta_meta):
+            with open(self.ruta_meta, "r", encoding="utf-8") as f:
+                self.meta.update(json.load(f))
+
+    @property
+    def columnas(self):
+        return self.meta["columnas"]
+
+    def __len__(self):
+        return self.meta["filas"]
+
+    def ultima_fecha(self):
+        """Marca de tiempo de la última fila guardada (None si está vacío)"""
+        if self.meta["ultima_fecha"] is None:
+            return None
+        return pd.Timestamp(self.meta["ultima_fecha"])
+
+    def _guardar_meta(self):
+        temporal = self.ruta_meta + ".tmp"
+        with open(temporal, "w", encoding="utf-8") as f:
+            json.dump(self.meta, f, indent=2, ensure_ascii=False)
+        os.replace(temporal, self.ruta_meta)
+
+    def agregar(self, df, filas_fuente=None, columnas_fuente=None):
+        """Agrega las filas posteriores a la última fecha guardada; devuelve cuántas entraron"""
+        os.makedirs(self.carpeta, exist_ok=True)
+        df = df[df.index.notnull()]
+        df = df[~df.index.duplicated(keep="last")].sort_index()
+        ultima = self.ultima_fecha()
+        if ultima is not None:
+            df = df[df.index > ultima]
+
+        if len(df):
+            fechas = df.index.as_unit("ns").asi8.astype(np.int64)
+            valores = (
+                df.reindex(columns=self.columnas)
+                .apply(pd.to_numeric, errors="coerce")
+                .to_numpy(dtype=np.float64)
+            )
+            n = self.meta["filas"]
+            for ruta, datos, ancho in (
+                (self.ruta_fechas, fechas, 8),
+                (self.ruta_valores, np.ascontiguousarray(valores), 8 * len(self.columnas)),
+            ):
+                with open(ruta, "r+b" if os.path.exists(ruta) else "wb") as f:
+                    f.seek(n * ancho)
+                    f.write(datos.tobytes())
+                    f.truncate()
+            self.meta["filas"] = n + len(df)
+            self.meta["ultima_fecha"] = df.index[-1].strftime("%Y-%m-%d %H:%M:%S")
+
+        if filas_fuente is not None:
+            self.meta["filas_fuente"] = int(filas_fuente)
+        if columnas_fuente is not None:
+            self.meta["columnas_fuente"] = list(columnas_fuente)
+        self._guardar_meta()
+        return len(df)
+
+    def _leer(self, inicio, fin):
+        """Lee las filas [inicio, fin) sin cargar el resto del archivo"""
+        k = len(self.columnas)
+        if fin <= inicio:
+            return pd.DataFrame(columns=self.columnas, index=pd.DatetimeIndex([], name="date"))
+        fechas = np.memmap(self.ruta_fechas, dtype=np.int64, mode="r", shape=(self.meta["filas"],))
+        valores = np.memmap(
+            self.ruta_valores, dtype=np.float64, mode="r", shape=(self.meta["filas"], k)
+        )
+        indice = pd.DatetimeIndex(np.array(fechas[inicio:fin]).view("datetime64[ns]"), name="date")
+        return pd.DataFrame(np.array(valores[inicio:fin]), index=indice, columns=self.columnas)
+
+    def cola(self, n):
+        """Últimas ``n`` filas del historial"""
+        total = self.meta["filas"]
+        return self._leer(max(0, total - n), total)
+
+    def ultimas_horas(self, horas):
+        """Filas de las últimas ``horas`` horas, contadas desde la última fecha guardada"""
+        ultima = self.ultima_fecha()
+        if ultima is None:
+            return self._leer(0, 0)
+        return self.desde(ultima - pd.Timedelta(hours=horas))
+
+    def desde(self, fecha):
+        """Filas con marca de tiempo posterior a ``fecha``"""
+        total = self.meta["filas"]
+        if total == 0:
+            return self._leer(0, 0)
+        fechas = np.memmap(self.ruta_fechas, dtype=np.int64, mode="r", shape=(total,))
+        inicio = int(np.searchsorted(fechas, pd.Timestamp(fecha).as_unit("ns").value, side="right"))
+        return self._leer(inicio, total)
+
+
+def leer_filas_fuente(fuente, desde=0, columnas=None, plantilla_incremental=None):
+    """Lee las filas de datos de la fuente CSV a partir de la fila ``desde`` (0 = primera)
+
+    ``fuente`` es una ruta local o URL con la tabla completa; de ella se descartan
+    las filas ya leídas. Si se da ``plantilla_incremental`` (URL con ``{fila}``,
+    el número de fila de la hoja con 1 = encabezado) y se conocen las
+    ``columnas``, se piden al servidor solo las filas nuevas, sin encabezado.
+    """
+    try:
+        if plantilla_incremental and desde > 0 and columnas:
+            return pd.read_csv(
+                plantilla_incremental.format(fila=desde + 2), header=None, names=columnas
+            )
+        return pd.read_csv(fuente, skiprows=range(1, desde + 1))
+    except pd.errors.EmptyDataError:
+        return pd.DataFrame(columns=columnas or [])
+
+
+def sincronizar_historial(historial, fuente, parsear, plantilla_incremental=None):
+    """Descarga solo las filas nuevas de la fuente y las agrega al historial
+
+    ``parsear`` convierte las filas crudas en un DataFrame numérico con índice de
+    fechas. Devuelve el número de filas nuevas guardadas.
+    """
+    desde = max(0, historial.meta["filas_fuente"] - FILAS_SOLAPE) if len(historial) else 0
+    crudo = leer_filas_fuente(
+        fuente, desde, historial.meta["columnas_fuente"], plantilla_incremental
+    )
+    if len(crudo) == 0:
+        return 0
+    return historial.agregar(
+        parsear(crudo),
+        filas_fuente=desde + len(crudo),
+        columnas_fuente=list(crudo.columns),
+    )
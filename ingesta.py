@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+"""Servicio de ingesta: recibe las lecturas del ESP32 y las agrega por hora al llegar
+
+Acepta los mismos campos POST que Insertar2.php (``temperatura``, ``humedad``,
+``pm1_0``, ``pm2_5``, ``pm10``), mantiene conteo, suma, mínimo y máximo por hora
+en un buffer circular y guarda cada hora cerrada en el historial horario, que el
+modelo lee sin volver a remuestrear.
+
+Uso:
+    python ingesta.py [puerto]
+
+    POST /insertar   lectura del sensor (application/x-www-form-urlencoded)
+    GET  /horario    agregados de las últimas horas, incluida la hora en curso
+    GET  /agregados/<resolucion>   archivo de agregados.py (10min, 1h, 1d), con ETag
+"""
+
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+
+from agregados import RUTA_AGREGADOS, respuesta_condicional
+from fuentes_datos import COLUMNAS_SENSOR
+from historial import HistorialSensores
+
+RUTA_HISTORIAL_HORARIO = "datos/historial_horario"
+
+# Horas que conserva el buffer (la hora en curso y las cerradas aún no guardadas)
+CAPACIDAD_HORAS = 48
+
+# Cada cuántos segundos se revisa si hay horas vencidas sin lecturas nuevas
+INTERVALO_CIERRE = 60
+
+VARIABLES_INGESTA = list(COLUMNAS_SENSOR.values())
+NS_POR_HORA = 3600 * 10**9
+
+
+def columnas_horarias(variables=VARIABLES_INGESTA):
+    """Columnas del historial horario: media, mínimo, máximo y conteo por variable"""
+    columnas = list(variables)
+    for var in variables:
+        columnas += [f"{var} min", f"{var} max", f"{var} n"]
+    return columnas
+
+
+class AgregadorHorario:
+    """Agregados horarios en un buffer circular de ``capacidad`` horas
+
+    Cada hueco guarda el identificador de la hora (horas desde 1970) y, por
+    variable, conteo, suma, mínimo y máximo. Una hora se cierra cuando llega una
+    lectura de una hora posterior o cuando vence en el reloj.
+    """
+
+    def __init__(self, historial, variables=VARIABLES_INGESTA, capacidad=CAPACIDAD_HORAS):
+        self.historial = historial
+        self.variables = list(variables)
+        self.capacidad = capacidad
+        k = len(self.variables)
+        self.horas = np.full(capacidad, -1, dtype=np.int64)
+        self.conteo = np.zeros((capacidad, k), dtype=np.int64)
+        self.suma = np.zeros((capacidad, k))
+        self.minimo = np.full((capacidad, k), np.inf)
+        self.maximo = np.full((capacidad, k), -np.inf)
+        self.hora_actual = -1
+        self.lock = threading.Lock()
+
+        ultima = historial.ultima_fecha()
+        self.ultima_guardada = -1 if ultima is None else ultima.value // NS_POR_HORA
+
+    def _limpiar(self, hueco, hora):
+        self.horas[hueco] = hora
+        self.conteo[hueco] = 0
+        self.suma[hueco] = 0.0
+        self.minimo[hueco] = np.inf
+        self.maximo[hueco] = -np.inf
+
+    def agregar(self, fecha, valores):
+        """Suma una lectura (dict variable -> valor) a su hora; devuelve False si llega tarde"""
+        hora = pd.Timestamp(fecha).as_unit("ns").value // NS_POR_HORA
+        with self.lock:
+            if hora <= self.ultima_guardada or hora <= self.hora_actual - self.capacidad:
+                return False
+            if hora > self.hora_actual:
+                self._cerrar_hasta(hora)
+                self.hora_actual = hora
+            hueco = hora % self.capacidad
+            if self.horas[hueco] != hora:
+                self._limpiar(hueco, hora)
+
+            fila = np.array([valores.get(var, np.nan) for var in self.variables], dtype=float)
+            presentes = ~np.isnan(fila)
+            self.conteo[hueco, presentes] += 1
+            self.suma[hueco, presentes] += fila[presentes]
+            self.minimo[hueco] = np.fmin(self.minimo[hueco], fila)
+            self.maximo[hueco] = np.fmax(self.maximo[hueco], fila)
+            return True
+
+    def _tabla(self, huecos):
+        """DataFrame con media, mínimo, máximo y conteo de los huecos indicados"""
+        conteo = self.conteo[huecos]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            media = self.suma[huecos] / conteo
+        vacio = conteo == 0
+        datos = {}
+        for j, var in enumerate(self.variables):
+            datos[var] = np.where(vacio[:, j], np.nan, media[:, j])
+        for j, var in enumerate(self.variables):
+            datos[f"{var} min"] = np.where(vacio[:, j], np.nan, self.minimo[huecos, j])
+            datos[f"{var} max"] = np.where(vacio[:, j], np.nan, self.maximo[huecos, j])
+            datos[f"{var} n"] = conteo[:, j].astype(float)
+        indice = pd.DatetimeIndex(
+            (self.horas[huecos] * NS_POR_HORA).view("datetime64[ns]"), name="date"
+        )
+        return pd.DataFrame(datos, index=indice)
+
+    def _cerrar_hasta(self, hora):
+        """Guarda en el historial todas las horas anteriores a ``hora`` (llamar con lock)"""
+        cerradas = (self.horas >= 0) & (self.horas < hora) & (self.horas > self.ultima_guardada)
+        huecos = np.flatnonzero(cerradas)
+        if len(huecos) == 0:
+            return 0
+        huecos = huecos[np.argsort(self.horas[huecos])]
+        self.historial.agregar(self._tabla(huecos))
+        self.ultima_guardada = int(self.horas[huecos[-1]])
+        return len(huecos)
+
+    def cerrar_vencidas(self, ahora=None):
+        """Cierra las horas que ya terminaron en el reloj aunque no lleguen lecturas"""
+        ahora = pd.Timestamp.now() if ahora is None else pd.Timestamp(ahora)
+        with self.lock:
+            return self._cerrar_hasta(ahora.as_unit("ns").value // NS_POR_HORA)
+
+    def horario(self):
+        """Agregados vigentes (horas aún en el buffer, incluida la hora en curso)"""
+        with self.lock:
+            huecos = np.flatnonzero(self.horas >= 0)
+            huecos = huecos[np.argsort(self.horas[huecos])]
+            return self._tabla(huecos)
+
+
+def leer_campos(cuerpo):
+    """Convierte el cuerpo POST del ESP32 en (fecha, {variable: valor})"""
+    campos = {k: v[-1] for k, v in parse_qs(cuerpo).items()}
+    valores = {}
+    for campo, var in COLUMNAS_SENSOR.items():
+        try:
+            valores[var] = float(campos[campo])
+        except (KeyError, ValueError):
+            valores[var] = np.nan
+    fecha = pd.Timestamp(campos["fecha_hora"]) if "fecha_hora" in campos else pd.Timestamp.now()
+    return fecha, valores
+
+
+def crear_manejador(agregador):
+    """Manejador HTTP ligado a un agregador"""
+
+    class ManejadorIngesta(BaseHTTPRequestHandler):
+        def _responder(self, codigo, cuerpo, tipo="text/plain; charset=utf-8", etag=None):
+            datos = cuerpo if isinstance(cuerpo, bytes) else cuerpo.encode("utf-8")
+            self.send_response(codigo)
+            self.send_header("Content-Type", tipo)
+            self.send_header("Content-Length", str(len(datos)))
+            self.send_header("Access-Control-Allow-Origin", "*")
+            if etag:
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            self.wfile.write(datos)
+
+        def do_POST(self):
+            if urlparse(self.path).path not in ("/insertar", "/Insertar2.php"):
+                self._responder(404, "No encontrado")
+                return
+            longitud = int(self.headers.get("Content-Length", 0))
+            cuerpo = self.rfile.read(longitud).decode("utf-8")
+            try:
+                fecha, valores = leer_campos(cuerpo)
+            except ValueError as e:
+                self._responder(400, f"❌ Error: {e}")
+                return
+            if agregador.agregar(fecha, valores):
+                self._responder(200, "✅ Datos guardados correctamente")
+            else:
+                self._responder(409, "❌ Error: lectura de una hora ya cerrada")
+
+        def do_GET(self):
+            ruta = urlparse(self.path).path
+            if ruta.startswith("/agregados/"):
+                codigo, cuerpo, etag = respuesta_condicional(
+                    RUTA_AGREGADOS, ruta[len("/agregados/"):], self.headers.get("If-None-Match")
+                )
+                if codigo == 404:
+                    self._responder(404, "No encontrado")
+                else:
+                    self._responder(codigo, cuerpo or b"", "application/json; charset=utf-8", etag)
+                return
+            if ruta != "/horario":
+                self._responder(404, "No encontrado")
+                return
+            tabla = agregador.horario()
+            registros = [
+                {"fecha": fecha.strftime("%Y-%m-%d %H:%M:%S"),
+                 **{k: (None if pd.isna(v) else float(v)) for k, v in fila.items()}}
+                for fecha, fila in tabla.iterrows()
+            ]
+            self._responder(
+                200, json.dumps(registros, ensure_ascii=False), "application/json; charset=utf-8"
+            )
+
+        def log_message(self, formato, *args):
+            pass
+
+    return ManejadorIngesta
+
+
+def crear_servidor(puerto=8080, ruta_historial=RUTA_HISTORIAL_HORARIO, host="0.0.0.0"):
+    """Crea el servidor HTTP de ingesta y su agregador"""
+    historial = HistorialSensores(ruta_historial, columnas=columnas_horarias())
+    agregador = AgregadorHorario(historial)
+    servidor = ThreadingHTTPServer((host, puerto), crear_manejador(agregador))
+    return servidor, agregador
+
+
+def main(puerto=8080):
+    servidor, agregador = crear_servidor(puerto)
+    detener = threading.Event()
+
+    def cierre_periodico():
+        while not detener.wait(INTERVALO_CIERRE):
+            agregador.cerrar_vencidas()
+
+    threading.Thread(target=cierre_periodico, daemon=True).start()
+    print(f"📡 Ingesta escuchando en el puerto {puerto}")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        # La hora en curso no se guarda: seguiría recibiendo lecturas
+        detener.set()
+        servidor.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 8080))
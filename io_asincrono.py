@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""E/S concurrente con asyncio: descargas de estaciones y subida anticipada de blobs
+
+Las llamadas HTTP siguen siendo las de requests (con sus timeouts y reintentos),
+ejecutadas en hilos con ``asyncio.to_thread`` y limitadas por un semáforo. Así:
+
+- los datos de todas las estaciones se descargan a la vez;
+- el árbol publicado se consulta en segundo plano mientras se ajusta;
+- cada pronóstico se sube como blob apenas se escribe, y al final solo queda
+  armar el árbol y el commit (ver ``PublicadorGitHub.publicar``).
+
+Para probarlo sin red basta con apuntar las URLs (fuente de datos y
+GITHUB_API_URL) a servidores HTTP locales.
+"""
+
+import asyncio
+import os
+
+from publicador import sha_blob
+
+# Solicitudes HTTP simultáneas como máximo
+LIMITE_CONCURRENCIA = int(os.environ.get("SARIMA_CONCURRENCIA", 4))
+
+
+async def _con_limite(semaforo, funcion, *args):
+    """Ejecuta ``funcion`` bloqueante en un hilo, dentro del semáforo"""
+    async with semaforo:
+        return await asyncio.to_thread(funcion, *args)
+
+
+async def descargar_estaciones(estaciones, cargar, limite=LIMITE_CONCURRENCIA):
+    """Carga los datos de todas las estaciones en paralelo: {id: DataFrame}
+
+    ``cargar`` recibe la estación y devuelve sus datos crudos (bloqueante).
+    """
+    semaforo = asyncio.Semaphore(limite)
+    datos = await asyncio.gather(*(_con_limite(semaforo, cargar, e) for e in estaciones))
+    return {estacion["id"]: df for estacion, df in zip(estaciones, datos)}
+
+
+class PublicacionAsincrona:
+    """Sube cada archivo como blob en cuanto está listo y publica todo en un solo commit
+
+    Debe crearse dentro del bucle de eventos: la consulta de los blobs publicados
+    empieza de inmediato. Los archivos que no cambiaron no se suben.
+    """
+
+    def __init__(self, publicador, limite=LIMITE_CONCURRENCIA):
+        self.publicador = publicador
+        self.semaforo = asyncio.Semaphore(limite)
+        self.remotos = asyncio.ensure_future(asyncio.to_thread(publicador.blobs_actuales))
+        self.archivos = {}
+        self.subidas = {}
+
+    def enviar(self, archivos):
+        """Agrega ``archivos`` ({nombre: texto o bytes}) y lanza la subida de sus blobs"""
+        for nombre, contenido in archivos.items():
+            self.archivos[nombre] = contenido
+            self.subidas[nombre] = asyncio.ensure_future(self._subir(nombre, contenido))
+
+    async def _subir(self, nombre, contenido):
+        """SHA del blob subido (None si el archivo publicado ya es igual)"""
+        remotos = await self.remotos
+        if remotos.get(nombre) == sha_blob(contenido):
+            return None
+        return await _con_limite(self.semaforo, self.publicador.subir_blob, contenido)
+
+    async def terminar(self, mensaje):
+        """Espera las subidas y crea el commit; devuelve los archivos que cambiaron
+
+        Un blob que no se pudo subir antes se envía dentro del propio commit.
+        """
+        try:
+            # Se espera aunque no haya subidas, para no dejar su resultado sin recoger
+            await self.remotos
+        except Exception as e:
+            print(f"  ⚠️  No se pudo consultar lo publicado ({e}), todo va en el commit")
+        try:
+            blobs = {}
+            for nombre, tarea in self.subidas.items():
+                try:
+                    sha = await tarea
+                except Exception as e:
+                    print(f"  ⚠️  Subida anticipada de {nombre} fallida ({e}), va en el commit")
+                    continue
+                if sha:
+                    blobs[nombre] = sha
+            return await asyncio.to_thread(self.publicador.publicar, self.archivos, mensaje, blobs)
+        finally:
+            await self.cancelar()
+
+    async def cancelar(self):
+        """Cancela la consulta y las subidas pendientes y recoge sus resultados
+
+        Se llama cuando la ejecución falla antes de ``terminar``: ninguna tarea
+        queda pendiente ni con su excepción sin recuperar.
+        """
+        tareas = [self.remotos, *self.subidas.values()]
+        for tarea in tareas:
+            tarea.cancel()
+        await asyncio.gather(*tareas, return_exceptions=True)
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""Instrumentación de las ejecuciones: tiempos por etapa, ajustes y perfil opcional
+
+``RegistroMetricas`` acumula el tiempo de cada etapa (carga, parseo, remuestreo,
+imputación o limpieza, búsqueda, exportación, publicación) y el detalle de los ajustes por
+serie, y lo guarda como ``metrics.json`` junto a ``pronosticos/index.json``.
+
+Con SARIMA_PERFIL=ruta.prof la ejecución completa se perfila con cProfile (solo
+el proceso principal: los ajustes en el pool se ven en el detalle por candidato;
+con SARIMA_TRABAJADORES=1 el perfil los incluye).
+"""
+
+import cProfile
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+RUTA_METRICAS = "pronosticos/metrics.json"
+
+
+class RegistroMetricas:
+    """Tiempos por etapa (segundos acumulados) y estadísticas de ajuste por serie"""
+
+    def __init__(self):
+        self.inicio = time.perf_counter()
+        self.fecha = time.strftime("%Y-%m-%d %H:%M:%S")
+        self.etapas = {}
+        self.series = {}
+        self.datos = {}
+        self._candado = threading.Lock()
+
+    def sumar(self, nombre, segundos):
+        """Acumula ``segundos`` en la etapa ``nombre`` (se puede llamar desde varios hilos)"""
+        with self._candado:
+            self.etapas[nombre] = self.etapas.get(nombre, 0.0) + segundos
+
+    @contextmanager
+    def etapa(self, nombre):
+        """Cronometra el bloque y lo acumula en la etapa ``nombre``"""
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.sumar(nombre, time.perf_counter() - inicio)
+
+    def cronometrar(self, nombre, funcion):
+        """Envuelve ``funcion`` para acumular su tiempo en la etapa ``nombre``"""
+        def envoltura(*args, **kwargs):
+            with self.etapa(nombre):
+                return funcion(*args, **kwargs)
+        return envoltura
+
+    def como_dict(self):
+        """Contenido de ``metrics.json``"""
+        return {
+            "fecha_ejecucion": self.fecha,
+            "segundos_total": round(time.perf_counter() - self.inicio, 4),
+            "etapas": {nombre: round(s, 4) for nombre, s in self.etapas.items()},
+            "series": self.series,
+            **self.datos,
+        }
+
+    def guardar(self, ruta=RUTA_METRICAS):
+        """Escribe el reporte en ``ruta``"""
+        os.makedirs(os.path.dirname(ruta) or ".", exist_ok=True)
+        with open(ruta, "w", encoding="utf-8") as f:
+            json.dump(self.como_dict(), f, indent=2, ensure_ascii=False)
+        return ruta
+
+
+def medir(metricas, nombre):
+    """Cronometra un bloque en ``metricas``; sin registro no hace nada"""
+    return metricas.etapa(nombre) if metricas is not None else nullcontext()
+
+
+@contextmanager
+def perfilar(ruta=None):
+    """Perfila el bloque con cProfile y vuelca las estadísticas en ``ruta`` (si se indica)"""
+    if not ruta:
+        yield None
+        return
+    perfil = cProfile.Profile()
+    perfil.enable()
+    try:
+        yield perfil
+    finally:
+        perfil.disable()
+        os.makedirs(os.path.dirname(ruta) or ".", exist_ok=True)
+        perfil.dump_stats(ruta)
+        print(f"🧪 Perfil de cProfile guardado en {ruta}")
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""Pronósticos SARIMA de los sensores del datalogger
+
+``import modelo_sarima`` es liviano: los nombres de la biblioteca
+(``modelo_sarima.modelo``) se cargan al primer acceso, por ejemplo
+``modelo_sarima.buscar_mejor_modelo``. Línea de comandos:
+
+    python -m modelo_sarima [fit|update|export|publish|backtest]
+"""
+
+import importlib
+
+# Nombres públicos de la biblioteca que se resuelven en ``modelo_sarima.modelo``
+_PUBLICOS = frozenset({
+    "VARIABLES", "PERIODO_ESTACIONAL", "MAXITER", "MODO_BUSQUEDA", "N_TRABAJADORES",
+    "ESTACIONALIDAD", "POLITICA", "LIMPIEZA",
+    "cargar_datos_google_sheets", "generar_datos_ejemplo", "cargar_estaciones",
+    "parse_datetime_index", "preparar_datos_horarios", "limpiar_series",
+    "crear_sarimax", "pronosticar", "buscar_mejores_modelos", "buscar_mejor_modelo",
+    "buscar_con_estacionalidad", "obtener_modelos", "backtesting",
+    "exportar_pronosticos_json", "serializar_json", "guardar_pronostico",
+    "publicar_en_github", "crear_indice",
+    "main", "ejecutar", "actualizar", "exportar", "evaluar",
+})
+
+
+def __getattr__(nombre):
+    if nombre not in _PUBLICOS:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    modelo = importlib.import_module(".modelo", __name__)
+    return getattr(modelo, nombre)
+
+
+def __dir__():
+    return sorted(set(globals()) | _PUBLICOS)
@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+"""python -m modelo_sarima: ver ``modelo_sarima.cli``"""
+
+import sys
+
+from modelo_sarima.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
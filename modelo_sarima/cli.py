@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""Línea de comandos del modelo SARIMA
+
+    python -m modelo_sarima fit        # ajuste completo, exportación y publicación (por defecto)
+    python -m modelo_sarima update     # solo filtrado de las observaciones nuevas
+    python -m modelo_sarima export     # pronósticos locales con los modelos guardados
+    python -m modelo_sarima publish    # publica los archivos de pronosticos/ tal como están
+    python -m modelo_sarima backtest   # evaluación con origen móvil
+
+Cada comando importa solo lo que usa: ``publish`` no carga pandas, numpy ni
+statsmodels, y ningún comando carga matplotlib.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from metricas import perfilar
+
+CARPETA_PRONOSTICOS = "pronosticos"
+
+
+def _modelo():
+    """Biblioteca del modelo (pandas, numpy; statsmodels al primer ajuste)"""
+    from modelo_sarima import modelo
+    return modelo
+
+
+def comando_fit(args):
+    print("=" * 60)
+    print("🚀 INICIANDO MODELO SARIMA EN GITHUB ACTIONS")
+    print("=" * 60)
+    return _modelo().main()
+
+
+def comando_update(args):
+    return _modelo().actualizar()
+
+
+def comando_export(args):
+    return _modelo().exportar()
+
+
+def comando_backtest(args):
+    return _modelo().evaluar()
+
+
+def archivos_publicables(carpeta=CARPETA_PRONOSTICOS):
+    """Índice y pronósticos que lista ``index.json`` (más sus copias .gz): {nombre: contenido}"""
+    with open(os.path.join(carpeta, "index.json"), "r", encoding="utf-8") as f:
+        indice = json.load(f)
+    estaciones = indice.get("estaciones") or [{"archivos": indice.get("archivos", {})}]
+    nombres = ["index.json"] + [a for e in estaciones for a in e["archivos"].values()]
+
+    contenidos = {}
+    for nombre in nombres:
+        ruta = os.path.join(carpeta, nombre)
+        if os.path.exists(ruta):
+            with open(ruta, "r", encoding="utf-8") as f:
+                contenidos[nombre] = f.read()
+        if os.path.exists(ruta + ".gz"):
+            with open(ruta + ".gz", "rb") as f:
+                contenidos[nombre + ".gz"] = f.read()
+    return contenidos
+
+
+def comando_publish(args):
+    token = os.environ.get("GH_TOKEN", "")
+    if not token:
+        print("⚠️  No se encontró GH_TOKEN en variables de entorno; no se publica nada")
+        return 1
+    from publicador import API_GITHUB, PublicadorGitHub
+
+    contenidos = archivos_publicables(args.carpeta)
+    publicador = PublicadorGitHub(token, api=os.environ.get("GITHUB_API_URL", API_GITHUB))
+    subidos = publicador.publicar(
+        contenidos, f"🤖 Actualización automática de pronósticos {time.strftime('%Y-%m-%d %H:%M')}"
+    )
+    print(f"✅ Un commit con {len(subidos)} archivos ({len(contenidos) - len(subidos)} sin cambios)")
+    return 0
+
+
+def crear_parser():
+    parser = argparse.ArgumentParser(prog="python -m modelo_sarima", description=__doc__.splitlines()[0])
+    comandos = parser.add_subparsers(dest="comando")
+    comandos.add_parser("fit", help="ajuste completo, exportación y publicación").set_defaults(
+        funcion=comando_fit
+    )
+    comandos.add_parser("update", help="filtra las observaciones nuevas sin reajustar").set_defaults(
+        funcion=comando_update
+    )
+    comandos.add_parser("export", help="exporta pronósticos con los modelos guardados").set_defaults(
+        funcion=comando_export
+    )
+    publicar = comandos.add_parser("publish", help="publica los archivos ya exportados")
+    publicar.add_argument("--carpeta", default=CARPETA_PRONOSTICOS)
+    publicar.set_defaults(funcion=comando_publish)
+    comandos.add_parser("backtest", help="evaluación con origen móvil").set_defaults(
+        funcion=comando_backtest
+    )
+    parser.set_defaults(funcion=comando_fit)
+    return parser
+
+
+def main(argv=None):
+    args = crear_parser().parse_args(argv)
+    try:
+        # SARIMA_PERFIL=ruta.prof: perfil de cProfile de toda la ejecución
+        with perfilar(os.environ.get("SARIMA_PERFIL")):
+            return args.funcion(args)
+    except Exception as e:
+        print(f"\n❌ ERROR CRÍTICO: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
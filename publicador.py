@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""Publicación de pronósticos en GitHub con un solo commit (Git Data API)
+
+En lugar de un GET + PUT por archivo (un commit por archivo), se arma un árbol
+con todos los archivos que cambiaron y se crea un único commit:
+
+    ref -> commit -> árbol de la carpeta -> POST tree -> POST commit -> PATCH ref
+
+Los archivos cuyo contenido coincide con el del repositorio (mismo SHA de blob)
+no se envían. Los blobs pueden subirse antes, por separado (``subir_blob``), y
+pasarse a ``publicar``: así el commit final solo arma el árbol (ver io_asincrono). Todas las llamadas usan una sesión HTTP con conexiones reutilizadas
+y se reintentan con espera exponencial ante 409 y errores 5xx.
+"""
+
+import base64
+import hashlib
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+API_GITHUB = "https://api.github.com"
+REPOSITORIO = "majito0703/measure_data_logger"
+
+# Reintentos por llamada (409 / 5xx / error de conexión) y por actualización de la rama
+REINTENTOS = 4
+REINTENTOS_REF = 3
+ESPERA_BASE = 1.0
+
+
+class ErrorPublicacion(Exception):
+    """La API de GitHub rechazó la publicación"""
+
+
+def sha_blob(contenido):
+    """SHA-1 con el que git identifica un blob con este contenido"""
+    datos = contenido.encode("utf-8") if isinstance(contenido, str) else contenido
+    return hashlib.sha1(b"blob %d\0" % len(datos) + datos).hexdigest()
+
+
+def crear_sesion(token):
+    """Sesión HTTP autenticada con pool de conexiones"""
+    sesion = requests.Session()
+    sesion.headers.update({
+        "Authorization": f"token {token}",
+        "Accept": "application/vnd.github.v3+json",
+    })
+    adaptador = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+    sesion.mount("https://", adaptador)
+    sesion.mount("http://", adaptador)
+    return sesion
+
+
+class PublicadorGitHub:
+    """Publica varios archivos de una carpeta del repositorio en un solo commit"""
+
+    def __init__(self, token, repositorio=REPOSITORIO, rama="main", carpeta="pronosticos",
+                 api=API_GITHUB, sesion=None, reintentos=REINTENTOS, espera_base=ESPERA_BASE):
+        self.repositorio = repositorio
+        self.rama = rama
+        self.carpeta = carpeta.strip("/")
+        self.api = api.rstrip("/")
+        self.sesion = sesion or crear_sesion(token)
+        self.reintentos = reintentos
+        self.espera_base = espera_base
+
+    def _solicitud(self, metodo, ruta, **kwargs):
+        """Llamada a la API con reintentos; devuelve el JSON de la respuesta"""
+        url = f"{self.api}/repos/{self.repositorio}/{ruta}"
+        kwargs.setdefault("timeout", 30)
+        for intento in range(self.reintentos + 1):
+            try:
+                respuesta = self.sesion.request(metodo, url, **kwargs)
+            except requests.RequestException:
+                if intento == self.reintentos:
+                    raise
+            else:
+                if respuesta.status_code < 300:
+                    return respuesta.json()
+                if respuesta.status_code != 409 and respuesta.status_code < 500:
+                    raise ErrorPublicacion(
+                        f"{metodo} {ruta}: {respuesta.status_code} {respuesta.text[:100]}"
+                    )
+                if intento == self.reintentos:
+                    raise ErrorPublicacion(
+                        f"{metodo} {ruta}: {respuesta.status_code} tras {intento} reintentos"
+                    )
+            time.sleep(self.espera_base * 2 ** intento)
+
+    def _blobs_remotos(self, sha_arbol):
+        """SHA de los blobs de la carpeta y sus subcarpetas en el árbol indicado: {ruta: sha}"""
+        for parte in self.carpeta.split("/") if self.carpeta else []:
+            arbol = self._solicitud("GET", f"git/trees/{sha_arbol}")
+            sub = next((e for e in arbol["tree"] if e["path"] == parte and e["type"] == "tree"), None)
+            if sub is None:
+                return {}
+            sha_arbol = sub["sha"]
+        # Un solo GET recursivo trae también las carpetas de cada estación
+        arbol = self._solicitud("GET", f"git/trees/{sha_arbol}", params={"recursive": "1"})
+        return {e["path"]: e["sha"] for e in arbol["tree"] if e["type"] == "blob"}
+
+    def _commit_actual(self):
+        """SHA del último commit de la rama y sus datos (incluye el árbol)"""
+        ref = self._solicitud("GET", f"git/ref/heads/{self.rama}")
+        sha_padre = ref["object"]["sha"]
+        return sha_padre, self._solicitud("GET", f"git/commits/{sha_padre}")
+
+    def blobs_actuales(self):
+        """SHA de los blobs publicados ahora en la carpeta: {ruta: sha}"""
+        _, commit = self._commit_actual()
+        return self._blobs_remotos(commit["tree"]["sha"])
+
+    def subir_blob(self, contenido):
+        """Crea el blob de un archivo (texto o bytes) y devuelve su SHA"""
+        datos = contenido.encode("utf-8") if isinstance(contenido, str) else contenido
+        blob = self._solicitud("POST", "git/blobs", json={
+            "content": base64.b64encode(datos).decode("ascii"),
+            "encoding": "base64",
+        })
+        return blob["sha"]
+
+    def publicar(self, archivos, mensaje, blobs=None):
+        """Publica ``archivos`` ({nombre: texto o bytes}) en un solo commit
+
+        ``blobs`` ({nombre: sha}) son blobs ya subidos con ``subir_blob``; los que
+        no coinciden con el contenido actual se ignoran. Devuelve la lista de
+        archivos que cambiaron (vacía si no hubo commit).
+        """
+        blobs = blobs or {}
+        for intento in range(REINTENTOS_REF):
+            sha_padre, commit_padre = self._commit_actual()
+            remotos = self._blobs_remotos(commit_padre["tree"]["sha"])
+
+            cambiados = [n for n, c in archivos.items() if remotos.get(n) != sha_blob(c)]
+            if not cambiados:
+                return []
+
+            prefijo = f"{self.carpeta}/" if self.carpeta else ""
+            entradas = []
+            for n in cambiados:
+                entrada = {"path": prefijo + n, "mode": "100644", "type": "blob"}
+                if blobs.get(n) == sha_blob(archivos[n]):
+                    entrada["sha"] = blobs[n]
+                elif isinstance(archivos[n], bytes):
+                    # Binarios (p. ej. .json.gz): blob previo en base64
+                    entrada["sha"] = self.subir_blob(archivos[n])
+                else:
+                    entrada["content"] = archivos[n]
+                entradas.append(entrada)
+            arbol = self._solicitud("POST", "git/trees", json={
+                "base_tree": commit_padre["tree"]["sha"],
+                "tree": entradas,
+            })
+            commit = self._solicitud("POST", "git/commits", json={
+                "message": mensaje,
+                "tree": arbol["sha"],
+                "parents": [sha_padre],
+            })
+            try:
+                self._solicitud("PATCH", f"git/refs/heads/{self.rama}", json={"sha": commit["sha"]})
+                return cambiados
+            except ErrorPublicacion:
+                # La rama avanzó entre tanto (no es fast-forward): rehacer sobre el nuevo commit
+                if intento == REINTENTOS_REF - 1:
+                    raise
+        return []
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""Las pruebas importan los módulos de la raíz del repositorio
+
+También define los servidores HTTP locales que reemplazan a la red: uno de
+archivos estáticos (fuentes CSV/JSON) y uno que imita la Git Data API de GitHub.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+from functools import partial
+from http.server import BaseHTTPRequestHandler, SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _servir(servidor):
+    """Arranca ``servidor`` en un hilo y devuelve su URL base"""
+    hilo = threading.Thread(target=servidor.serve_forever, args=(0.05,), daemon=True)
+    hilo.start()
+    return f"http://127.0.0.1:{servidor.server_address[1]}"
+
+
+class _ArchivosLentos(SimpleHTTPRequestHandler):
+    retraso = 0.0
+
+    def do_GET(self):
+        time.sleep(self.retraso)
+        super().do_GET()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def servidor_archivos(tmp_path):
+    """Sirve por HTTP la carpeta ``tmp_path / "web"``; devuelve (url, carpeta, fijar_retraso)"""
+    carpeta = tmp_path / "web"
+    carpeta.mkdir()
+    manejador = type("Manejador", (_ArchivosLentos,), {})
+    servidor = ThreadingHTTPServer(
+        ("127.0.0.1", 0), partial(manejador, directory=str(carpeta))
+    )
+    url = _servir(servidor)
+
+    def fijar_retraso(segundos):
+        manejador.retraso = segundos
+
+    yield url, carpeta, fijar_retraso
+    servidor.shutdown()
+    servidor.server_close()
+
+
+def _sha(prefijo, datos):
+    return hashlib.sha1(b"%s %d\0" % (prefijo, len(datos)) + datos).hexdigest()
+
+
+class GitHubFalso:
+    """Repositorio en memoria con los extremos de la Git Data API que usa el publicador
+
+    Los árboles se guardan planos ({ruta: sha del blob}); un subárbol es el árbol
+    plano de lo que cuelga de esa carpeta. ``fallos`` es una lista de
+    (método, fragmento de ruta, código) que se consumen en orden al coincidir,
+    para simular 409 y 5xx. ``solicitudes`` registra (método, ruta, instante).
+    """
+
+    def __init__(self):
+        self.blobs = {}
+        self.arboles = {}
+        self.commits = {}
+        self.fallos = []
+        self.solicitudes = []
+        self.retraso_blob = 0.0
+        self._candado = threading.Lock()
+        self.ref = self._guardar_commit(
+            self._guardar_arbol({"README.md": self._guardar_blob(b"# repo\n")}), [], "inicial"
+        )
+
+    def _guardar_blob(self, datos):
+        sha = _sha(b"blob", datos)
+        self.blobs[sha] = datos
+        return sha
+
+    def _guardar_arbol(self, plano):
+        sha = _sha(b"tree", json.dumps(plano, sort_keys=True).encode())
+        self.arboles[sha] = dict(plano)
+        return sha
+
+    def _guardar_commit(self, arbol, padres, mensaje):
+        datos = {"tree": arbol, "parents": padres, "message": mensaje}
+        sha = _sha(b"commit", json.dumps(datos, sort_keys=True).encode())
+        self.commits[sha] = datos
+        return sha
+
+    # Preparación y consultas de las pruebas
+    def sembrar(self, archivos):
+        """Commit directo en la rama (sin pasar por la API) con ``archivos`` {ruta: texto}"""
+        plano = dict(self.arboles[self.commits[self.ref]["tree"]])
+        plano.update({r: self._guardar_blob(c.encode("utf-8")) for r, c in archivos.items()})
+        self.ref = self._guardar_commit(self._guardar_arbol(plano), [self.ref], "sembrado")
+
+    def archivos(self):
+        """Contenido publicado en la rama: {ruta: texto}"""
+        arbol = self.arboles[self.commits[self.ref]["tree"]]
+        return {ruta: self.blobs[sha].decode("utf-8") for ruta, sha in arbol.items()}
+
+    def contar(self, metodo, fragmento):
+        return sum(1 for m, r, _ in self.solicitudes if m == metodo and fragmento in r)
+
+    def instantes(self, metodo, fragmento):
+        return [t for m, r, t in self.solicitudes if m == metodo and fragmento in r]
+
+    # Extremos de la API
+    def _arbol_json(self, sha, recursivo):
+        plano = self.arboles[sha]
+        if recursivo:
+            return [{"path": r, "type": "blob", "mode": "100644", "sha": s} for r, s in plano.items()]
+        entradas, carpetas = [], {}
+        for ruta, blob in plano.items():
+            cabeza, _, resto = ruta.partition("/")
+            if resto:
+                carpetas.setdefault(cabeza, {})[resto] = blob
+            else:
+                entradas.append({"path": ruta, "type": "blob", "mode": "100644", "sha": blob})
+        for nombre, sub in carpetas.items():
+            entradas.append(
+                {"path": nombre, "type": "tree", "mode": "040000", "sha": self._guardar_arbol(sub)}
+            )
+        return entradas
+
+    def atender(self, metodo, ruta, consulta, cuerpo):
+        """(código, JSON) de una solicitud a ``/repos/<dueño>/<repo>/<ruta>``"""
+        with self._candado:
+            self.solicitudes.append((metodo, ruta, time.perf_counter()))
+            for i, (m, fragmento, codigo) in enumerate(self.fallos):
+                if m == metodo and fragmento in ruta:
+                    del self.fallos[i]
+                    return codigo, {"message": "fallo simulado"}
+
+        if metodo == "POST" and ruta == "git/blobs":
+            time.sleep(self.retraso_blob)
+        with self._candado:
+            if metodo == "GET" and ruta.startswith("git/ref/heads/"):
+                return 200, {"object": {"sha": self.ref}}
+            if metodo == "GET" and ruta.startswith("git/commits/"):
+                sha = ruta.rsplit("/", 1)[1]
+                return 200, {"sha": sha, "tree": {"sha": self.commits[sha]["tree"]}}
+            if metodo == "GET" and ruta.startswith("git/trees/"):
+                sha = ruta.rsplit("/", 1)[1]
+                return 200, {"sha": sha, "tree": self._arbol_json(sha, "recursive=1" in consulta)}
+            if metodo == "POST" and ruta == "git/blobs":
+                return 201, {"sha": self._guardar_blob(base64.b64decode(cuerpo["content"]))}
+            if metodo == "POST" and ruta == "git/trees":
+                plano = dict(self.arboles[cuerpo["base_tree"]])
+                for entrada in cuerpo["tree"]:
+                    if "content" in entrada:
+                        plano[entrada["path"]] = self._guardar_blob(entrada["content"].encode("utf-8"))
+                    else:
+                        assert entrada["sha"] in self.blobs
+                        plano[entrada["path"]] = entrada["sha"]
+                return 201, {"sha": self._guardar_arbol(plano)}
+            if metodo == "POST" and ruta == "git/commits":
+                sha = self._guardar_commit(cuerpo["tree"], cuerpo["parents"], cuerpo["message"])
+                return 201, {"sha": sha}
+            if metodo == "PATCH" and ruta.startswith("git/refs/heads/"):
+                if self.commits[cuerpo["sha"]]["parents"] != [self.ref]:
+                    return 422, {"message": "Update is not a fast forward"}
+                self.ref = cuerpo["sha"]
+                return 200, {"object": {"sha": self.ref}}
+        return 404, {"message": "Not Found"}
+
+
+def _manejador_github(repositorio):
+    class Manejador(BaseHTTPRequestHandler):
+        def _responder(self, metodo):
+            ruta, _, consulta = self.path.partition("?")
+            coincidencia = re.fullmatch(r"/repos/[^/]+/[^/]+/(.+)", ruta)
+            largo = int(self.headers.get("Content-Length") or 0)
+            cuerpo = json.loads(self.rfile.read(largo)) if largo else None
+            if coincidencia is None:
+                codigo, datos = 404, {"message": "Not Found"}
+            else:
+                codigo, datos = repositorio.atender(metodo, coincidencia.group(1), consulta, cuerpo)
+            contenido = json.dumps(datos).encode()
+            self.send_response(codigo)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(contenido)))
+            self.end_headers()
+            self.wfile.write(contenido)
+
+        def do_GET(self):
+            self._responder("GET")
+
+        def do_POST(self):
+            self._responder("POST")
+
+        def do_PATCH(self):
+            self._responder("PATCH")
+
+        def log_message(self, *args):
+            pass
+
+    return Manejador
+
+
+@pytest.fixture
+def github_falso():
+    """(URL de la API, GitHubFalso) servido en un puerto local"""
+    repositorio = GitHubFalso()
+    servidor = ThreadingHTTPServer(("127.0.0.1", 0), _manejador_github(repositorio))
+    url = _servir(servidor)
+    yield url, repositorio
+    servidor.shutdown()
+    servidor.server_close()
+
+
+@pytest.fixture
+def entorno_ejecucion(tmp_path, monkeypatch):
+    """Carpeta de trabajo vacía, fuente CSV local, sin token y una rejilla mínima"""
+    pytest.importorskip("statsmodels")
+    from modelo_sarima import modelo as ms
+
+    monkeypatch.chdir(tmp_path)
+    ruta = tmp_path / "sensores.csv"
+    ms.generar_datos_ejemplo(300, fin="2026-01-01", semilla=0, ciclo_diario=1.0).to_csv(
+        ruta, index=False
+    )
+    monkeypatch.setenv("SARIMA_FUENTE_DATOS", str(ruta))
+    monkeypatch.delenv("GH_TOKEN", raising=False)
+    monkeypatch.setattr(ms, "N_TRABAJADORES", 1)
+    monkeypatch.setattr(ms, "MODO_BUSQUEDA", "exhaustivo")
+    monkeypatch.setattr(ms, "ESTACIONALIDAD", "sarima")
+    monkeypatch.setattr(
+        ms, "RANGOS_ORDENES", {"p": (0, 1), "d": (0,), "q": (0,), "P": (0,), "D": (0,), "Q": (0,)}
+    )
+    return tmp_path
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""Búsqueda en dos fases: el cribado debe ordenar los candidatos como la búsqueda exhaustiva"""
+
+import pytest
+
+pytest.importorskip("pandas")
+pytest.importorskip("statsmodels")
+
+from modelo_sarima import modelo as ms  # noqa: E402
+
+# Rejilla con diferenciación (32 candidatos): la misma forma que la de producción sin Q
+CANDIDATOS = ms.generar_candidatos(Q=(0,), m=ms.PERIODO_ESTACIONAL)
+
+
+@pytest.fixture(scope="module")
+def serie():
+    df0 = ms.generar_datos_ejemplo(243, fin="2026-01-01", semilla=0, ciclo_diario=1.0)
+    return ms.preparar_datos_horarios(df0)["Temperature"].dropna()
+
+
+@pytest.fixture(scope="module")
+def validado(serie):
+    """Cribado con validación: ajusta toda la rejilla y compara ambos rankings"""
+    salida = ms._busqueda_cribada({"serie": serie}, CANDIDATOS, 1, 0, True, {})
+    return salida["serie"]
+
+
+def test_coincide_con_exhaustivo(serie, validado):
+    ganador, stats = validado
+    exhaustivo, _ = ms._busqueda_exhaustiva({"serie": serie}, CANDIDATOS, 1, {})["serie"]
+
+    assert stats["top_k"] == len(CANDIDATOS) // 4
+    assert stats["cribado"]["coincide_con_exhaustivo"]
+    assert stats["cribado"]["spearman"] > 0.85
+    assert ganador[1:3] == exhaustivo[1:3]
+    assert ganador[0] == pytest.approx(exhaustivo[0])
+
+
+def test_fase_uno_sobre_la_serie_completa_sin_optimizar(serie, validado):
+    _, stats = validado
+    cribado = [d for d in stats["detalle"] if d.get("fase") == "cribado"]
+    completos = [d for d in stats["detalle"] if "fase" not in d]
+
+    assert len(cribado) == len(completos) == len(CANDIDATOS)
+    # Una evaluación de la verosimilitud por candidato, sin iteraciones del optimizador
+    assert all(d["filas"] == len(serie) and d["iteraciones"] == 0 for d in cribado)
+    assert all(d["filas"] == len(serie) for d in completos)
+
+
+def test_sin_validar_ajusta_solo_los_mejores(serie):
+    estadisticas = {}
+    ms.buscar_mejores_modelos(
+        {"serie": serie}, n_trabajadores=1, candidatos=CANDIDATOS[:8], modo="cribado",
+        estadisticas=estadisticas,
+    )
+    stats = estadisticas["serie"]
+    assert stats["ajustes_cribado"] == 8
+    assert stats["ajustes"] == stats["top_k"] == 2
+    assert stats["omitidos"] == 6
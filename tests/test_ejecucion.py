@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+"""Ejecución completa (``python -m modelo_sarima fit``) sobre un CSV local pequeño"""
+
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("statsmodels")
+
+from modelo_sarima import modelo as ms  # noqa: E402
+
+
+@pytest.mark.parametrize("trabajadores", [1, 2])
+def test_ejecutar_sin_token_escribe_todo(entorno_ejecucion, monkeypatch, trabajadores):
+    # Con 2 trabajadores las búsquedas de cada serie comparten un pool de procesos
+    monkeypatch.setattr(ms, "N_TRABAJADORES", trabajadores)
+    assert asyncio.run(ms.ejecutar()) == 0
+
+    carpeta = entorno_ejecucion / "pronosticos"
+    indice = json.loads((carpeta / "index.json").read_text(encoding="utf-8"))
+    assert indice["variables"] == ms.VARIABLES
+    for archivo in indice["archivos"].values():
+        datos = json.loads((carpeta / archivo).read_text(encoding="utf-8"))
+        assert len(datos["pronosticos"]) == datos["horas_pronostico"] == 72
+    metricas = json.loads((carpeta / "metrics.json").read_text(encoding="utf-8"))
+    assert metricas["archivos_publicados"] == 0
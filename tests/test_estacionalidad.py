@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""Estacionalidad "auto": la elección se hace por MAE de validación, no por AIC"""
+
+import pytest
+
+pytest.importorskip("statsmodels")
+
+from modelo_sarima import modelo as ms  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def serie():
+    df0 = ms.generar_datos_ejemplo(243, fin="2026-01-01", semilla=0, ciclo_diario=1.0)
+    return ms.preparar_datos_horarios(df0)["Temperature"].dropna()
+
+
+def test_semanal_fuera_de_la_ventana_fija(serie):
+    assert all(2 * p <= len(serie) for p in ms.detectar_periodos(serie))
+    assert 168 not in ms.detectar_periodos(serie)
+
+
+def test_auto_compara_mae(serie):
+    estadisticas = {}
+    resultados = ms.buscar_con_estacionalidad(
+        {"serie": serie}, n_trabajadores=1, estacionalidad="auto", estadisticas=estadisticas
+    )
+    comparacion = estadisticas["serie"]["estacionalidad"]
+    assert comparacion["horizonte_validacion"] == ms.HORIZONTE_SELECCION
+    mae = {"sarima": comparacion["mae_sarima"], "fourier": comparacion["mae_fourier"]}
+    assert all(v is not None for v in mae.values())
+    assert comparacion["elegida"] == ("sarima" if mae["sarima"] < mae["fourier"] else "fourier")
+    assert resultados["serie"][0] is not None
+
+
+def test_serie_corta_no_valida(serie):
+    resultado = ms.buscar_mejor_modelo(serie, modo="stepwise")
+    assert ms.mae_validacion(serie.head(40), resultado) == float("inf")
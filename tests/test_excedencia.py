@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""Probabilidades de superar el límite en la exportación de pronósticos"""
+
+import pytest
+
+pytest.importorskip("statsmodels")
+
+from modelo_sarima import modelo as ms  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def ajuste_pm25():
+    df0 = ms.generar_datos_ejemplo(400, fin="2026-01-01", semilla=0, ciclo_diario=1.0)
+    serie = ms.preparar_datos_horarios(df0)["PM 2.5"].dropna()
+    modelo = ms.crear_sarimax(serie, (1, 0, 0), (0, 0, 0, ms.PERIODO_ESTACIONAL))
+    return modelo.fit(disp=False, maxiter=50), serie
+
+
+def test_probabilidad_por_hora(ajuste_pm25):
+    modelo, serie = ajuste_pm25
+    datos = ms.exportar_pronosticos_json(modelo, serie, pasos=72, var_name="PM 2.5", formato="completo")
+    probabilidades = [fila["prob_excedencia"] for fila in datos["pronosticos"]]
+    assert len(probabilidades) == 72
+    assert all(0.0 <= p <= 1.0 for p in probabilidades)
+
+
+def test_excedencia_simulada_presente(ajuste_pm25):
+    modelo, serie = ajuste_pm25
+    datos = ms.exportar_pronosticos_json(modelo, serie, pasos=72, var_name="PM 2.5")
+    simulada = datos["excedencia_simulada"]
+    assert "error" not in simulada
+    assert simulada["trayectorias"] == ms.SIMULACIONES_EXCEDENCIA
+    assert 0.0 <= simulada["24h"] <= simulada["72h"] <= 1.0
+
+
+def test_simulacion_reproducible(ajuste_pm25):
+    modelo, _ = ajuste_pm25
+    primera = ms.excedencia_simulada(modelo, 72, 37)
+    assert primera == ms.excedencia_simulada(modelo, 72, 37)
+
+
+def test_sin_limite_sin_excedencia(ajuste_pm25):
+    modelo, serie = ajuste_pm25
+    datos = ms.exportar_pronosticos_json(modelo, serie, pasos=24, var_name="Temperature")
+    assert "excedencia_simulada" not in datos
+    assert "prob_excedencia" not in datos["pronosticos"][0]
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""FuenteSQL sobre una copia SQLite de la tabla ``datos``: mismo resultado que el CSV"""
+
+import sqlite3
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from fuentes_datos import FuenteCSV, FuenteSQL, crear_fuente  # noqa: E402
+from modelo_sarima.modelo import generar_datos_ejemplo, parse_datetime_index  # noqa: E402
+
+FILAS = 250
+BLOQUE = 40
+COMUNES = ["Temperature", "Humidity", "PM 2.5", "PM 10"]
+
+
+class CursorContado:
+    """Cursor de sqlite3 que registra las consultas y las llamadas a ``fetchmany``"""
+
+    def __init__(self, cursor, registro):
+        self.cursor = cursor
+        self.registro = registro
+
+    def execute(self, sql, parametros):
+        self.registro["sql"].append(sql)
+        return self.cursor.execute(sql, parametros)
+
+    def fetchmany(self, n):
+        self.registro["bloques"] += 1
+        return self.cursor.fetchmany(n)
+
+    def close(self):
+        self.cursor.close()
+
+
+@pytest.fixture
+def datos(tmp_path):
+    """(ruta del CSV de la hoja, ruta de la base SQLite) con las mismas lecturas"""
+    hoja = generar_datos_ejemplo(FILAS, freq="10min", fin="2026-01-01 12:00", semilla=3).round(2)
+    # Como en la tabla real, el material particulado son enteros
+    for columna in ("PM 2.5(µg/m³)", "PM 10 (µg/m³)"):
+        hoja[columna] = hoja[columna].round().astype(int)
+    ruta_csv = tmp_path / "hoja.csv"
+    hoja.to_csv(ruta_csv, index=False)
+
+    ruta_db = tmp_path / "measure_datalog.db"
+    conexion = sqlite3.connect(ruta_db)
+    conexion.execute(
+        "CREATE TABLE datos (id INTEGER PRIMARY KEY, temperatura REAL, humedad REAL, "
+        "pm1_0 INTEGER, pm2_5 INTEGER, pm10 INTEGER, fecha TEXT)"
+    )
+    fechas = pd.to_datetime(hoja["Date"], format="%d/%m/%Y %H:%M:%S").dt.strftime("%Y-%m-%d %H:%M:%S")
+    filas = zip(
+        hoja["Temperature"], hoja["Humidity"], hoja["PM 2.5(µg/m³)"], hoja["PM 2.5(µg/m³)"],
+        hoja["PM 10 (µg/m³)"], fechas,
+    )
+    # Se insertan desordenadas: la fuente debe devolverlas por fecha
+    conexion.executemany(
+        "INSERT INTO datos (temperatura, humedad, pm1_0, pm2_5, pm10, fecha) VALUES (?, ?, ?, ?, ?, ?)",
+        list(filas)[::-1],
+    )
+    conexion.commit()
+    conexion.close()
+    return ruta_csv, ruta_db
+
+
+def _fuente_contada(ruta_db):
+    registro = {"sql": [], "bloques": 0}
+    conexion = sqlite3.connect(ruta_db)
+    fuente = FuenteSQL(
+        conexion, tamano_bloque=BLOQUE,
+        crear_cursor=lambda: CursorContado(conexion.cursor(), registro),
+    )
+    return fuente, registro
+
+
+def test_igual_que_csv_por_bloques(datos):
+    ruta_csv, ruta_db = datos
+    fuente, registro = _fuente_contada(ruta_db)
+
+    sql = fuente.leer()
+    csv = FuenteCSV(str(ruta_csv), parse_datetime_index).leer()
+
+    # Más filas que un bloque: varias llamadas a fetchmany (y la última vacía)
+    assert len(sql) == FILAS
+    assert registro["bloques"] == -(-FILAS // BLOQUE) + 1
+    assert isinstance(sql.index, pd.DatetimeIndex) and sql.index.name == "date"
+    pd.testing.assert_frame_equal(sql[COMUNES], csv[COMUNES])
+    assert sql["PM 1"].dtype == csv["PM 2.5"].dtype
+
+
+def test_rango_filtrado_en_la_consulta(datos):
+    ruta_csv, ruta_db = datos
+    fuente, registro = _fuente_contada(ruta_db)
+    csv = FuenteCSV(str(ruta_csv), parse_datetime_index).leer()
+    desde, hasta = csv.index[99], csv.index[199]
+
+    sql = fuente.leer(desde=desde, hasta=hasta)
+
+    assert "WHERE fecha > ? AND fecha <= ?" in registro["sql"][0]
+    assert len(sql) == 100
+    pd.testing.assert_frame_equal(sql[COMUNES], csv.loc[csv.index[100]:hasta, COMUNES])
+
+
+def test_desde_url(datos):
+    _, ruta_db = datos
+    fuente = crear_fuente(f"sqlite:///{ruta_db}", parse_datetime_index)
+    assert isinstance(fuente, FuenteSQL) and fuente.marcador == "?"
+    assert len(fuente.leer(desde="2026-01-01 11:00:00")) == 6
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""Fuentes CSV y JSON desde archivo local y servidor HTTP, e historial incremental"""
+
+import json
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+np = pytest.importorskip("numpy")
+pytest.importorskip("requests")
+
+from fuentes_datos import FuenteCSV, FuenteJSON, crear_fuente  # noqa: E402
+from historial import HistorialSensores, sincronizar_historial  # noqa: E402
+from modelo_sarima.modelo import generar_datos_ejemplo, parse_datetime_index  # noqa: E402
+
+REGISTROS = [
+    {"id": 3, "temperatura": 25.5, "humedad": 60, "pm1_0": 5, "pm2_5": 10, "pm10": 12,
+     "fecha_hora": "2026-02-11 10:20:00"},
+    {"id": 2, "temperatura": "24.1", "humedad": 61, "pm1_0": 4, "pm2_5": 9, "pm10": 11,
+     "fecha_hora": "2026-02-11 10:10:00"},
+    {"id": 1, "temperatura": 23.9, "humedad": 62, "pm1_0": 4, "pm2_5": 8, "pm10": 10,
+     "fecha_hora": "2026-02-11 10:00:00"},
+]
+
+
+def _csv(carpeta, filas=30):
+    ruta = carpeta / "sensores.csv"
+    generar_datos_ejemplo(filas, freq="10min", fin="2026-01-01", semilla=0).to_csv(ruta, index=False)
+    return ruta
+
+
+def _json(carpeta, registros=REGISTROS):
+    ruta = carpeta / "datos_sensores.json"
+    ruta.write_text(json.dumps(registros), encoding="utf-8")
+    return ruta
+
+
+@pytest.fixture(params=["archivo", "http"])
+def ubicar(request, tmp_path):
+    """Devuelve la ruta local o la URL del servidor HTTP para un archivo de la carpeta"""
+    if request.param == "archivo":
+        carpeta = tmp_path / "local"
+        carpeta.mkdir()
+        return carpeta, str
+    url, carpeta, _ = request.getfixturevalue("servidor_archivos")
+    return carpeta, lambda ruta: f"{url}/{ruta.name}"
+
+
+def test_csv(ubicar):
+    carpeta, ruta = ubicar
+    origen = _csv(carpeta)
+    fuente = crear_fuente(ruta(origen), parse_datetime_index)
+    assert isinstance(fuente, FuenteCSV)
+
+    df = fuente.leer()
+    assert len(df) == 30 and df.index.is_monotonic_increasing
+    assert df.index.name == "date" and isinstance(df.index, pd.DatetimeIndex)
+    assert list(df.columns) == ["Temperature", "Humidity", "PM 2.5", "PM 10", "Radiacion Solar"]
+    assert all(df[c].dtype == np.float64 for c in df.columns)
+
+    desde, hasta = df.index[9], df.index[19]
+    assert len(fuente.leer(desde=desde, hasta=hasta)) == 10
+
+
+def test_json(ubicar):
+    carpeta, ruta = ubicar
+    fuente = crear_fuente(ruta(_json(carpeta)), parse_datetime_index)
+    assert isinstance(fuente, FuenteJSON)
+
+    df = fuente.leer()
+    assert list(df.index.strftime("%H:%M")) == ["10:00", "10:10", "10:20"]
+    assert list(df.columns) == ["Temperature", "Humidity", "PM 1", "PM 2.5", "PM 10"]
+    assert df["Temperature"].tolist() == [23.9, 24.1, 25.5]
+    assert len(fuente.leer(desde="2026-02-11 10:00:00")) == 2
+
+
+def test_csv_sin_columna_de_fecha(ubicar):
+    carpeta, ruta = ubicar
+    origen = carpeta / "sin_fecha.csv"
+    pd.read_csv(_csv(carpeta)).drop(columns="Date").to_csv(origen, index=False)
+    with pytest.raises(ValueError, match="Date"):
+        FuenteCSV(ruta(origen), parse_datetime_index).leer()
+
+
+def test_csv_sin_una_variable(ubicar):
+    carpeta, ruta = ubicar
+    origen = carpeta / "sin_humedad.csv"
+    pd.read_csv(_csv(carpeta)).drop(columns="Humidity").to_csv(origen, index=False)
+    df = FuenteCSV(ruta(origen), parse_datetime_index).leer()
+    assert "Humidity" not in df.columns and len(df) == 30
+
+
+def test_csv_valores_invalidos(ubicar):
+    carpeta, ruta = ubicar
+    crudo = pd.read_csv(_csv(carpeta)).astype({"Temperature": object})
+    crudo.loc[3, "Date"] = "31/02/2026 10:00:00"
+    crudo.loc[4, "Date"] = "no es fecha"
+    crudo.loc[5, "Temperature"] = "error"
+    origen = carpeta / "invalidos.csv"
+    crudo.to_csv(origen, index=False)
+
+    df = FuenteCSV(ruta(origen), parse_datetime_index).leer()
+    # Las fechas inválidas se descartan; los números inválidos quedan como NaN
+    assert len(df) == 28
+    assert df["Temperature"].isna().sum() == 1
+
+
+def test_csv_malformado(ubicar):
+    carpeta, ruta = ubicar
+    origen = carpeta / "roto.csv"
+    origen.write_text('Date,Temperature\n"01/01/2026 00:00:00,1\n', encoding="utf-8")
+    with pytest.raises(ValueError):
+        FuenteCSV(ruta(origen), parse_datetime_index).leer()
+
+
+def test_json_sin_columnas(ubicar):
+    carpeta, ruta = ubicar
+    sin_pm1 = [{k: v for k, v in r.items() if k != "pm1_0"} for r in REGISTROS]
+    df = FuenteJSON(ruta(_json(carpeta, sin_pm1))).leer()
+    assert df["PM 1"].isna().all() and df["PM 10"].notna().all()
+
+    sin_fecha = [{k: v for k, v in r.items() if k != "fecha_hora"} for r in REGISTROS]
+    with pytest.raises(ValueError, match="fecha_hora"):
+        FuenteJSON(ruta(_json(carpeta, sin_fecha))).leer()
+
+
+def test_json_invalido(ubicar):
+    carpeta, ruta = ubicar
+    origen = carpeta / "roto.json"
+    origen.write_text('[{"temperatura": 1,', encoding="utf-8")
+    with pytest.raises(ValueError):
+        FuenteJSON(ruta(origen)).leer()
+
+    registros = [dict(REGISTROS[0], fecha_hora="11/02/2026"), dict(REGISTROS[1], humedad="--")]
+    df = FuenteJSON(ruta(_json(carpeta, registros))).leer()
+    assert len(df) == 1 and np.isnan(df["Humidity"].iloc[0])
+
+
+def test_historial_incremental(ubicar, tmp_path):
+    """Solo las filas nuevas entran al historial, sin duplicar el solape"""
+    carpeta, ruta = ubicar
+    completo = generar_datos_ejemplo(50, freq="10min", fin="2026-01-01", semilla=1)
+    origen = carpeta / "hoja.csv"
+    completo.head(30).to_csv(origen, index=False)
+    historial = HistorialSensores(tmp_path / "historial")
+
+    assert sincronizar_historial(historial, ruta(origen), parse_datetime_index) == 30
+    assert sincronizar_historial(historial, ruta(origen), parse_datetime_index) == 0
+    completo.to_csv(origen, index=False)
+    assert sincronizar_historial(historial, ruta(origen), parse_datetime_index) == 20
+
+    esperado = parse_datetime_index(completo)
+    guardado = historial.cola(100)
+    assert len(guardado) == 50 and guardado.index.equals(esperado.index)
+    np.testing.assert_allclose(guardado["Temperature"], esperado["Temperature"])
+    assert len(historial.ultimas_horas(2)) == 12
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""E/S concurrente contra servidores HTTP locales: descargas, subida anticipada y solape con los ajustes"""
+
+import asyncio
+import time
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("requests")
+
+from io_asincrono import PublicacionAsincrona, descargar_estaciones  # noqa: E402
+from publicador import PublicadorGitHub  # noqa: E402
+
+
+def _estaciones(url, carpeta, n):
+    estaciones = []
+    for i in range(n):
+        (carpeta / f"e{i}.csv").write_text(f"valor\n{i}\n", encoding="utf-8")
+        estaciones.append({"id": f"e{i}", "fuente": f"{url}/e{i}.csv"})
+    return estaciones
+
+
+@pytest.mark.parametrize("limite, minimo, maximo", [(4, 0.0, 0.9), (1, 1.2, 10.0)])
+def test_descargas_concurrentes_con_semaforo(servidor_archivos, limite, minimo, maximo):
+    url, carpeta, fijar_retraso = servidor_archivos
+    estaciones = _estaciones(url, carpeta, 4)
+    fijar_retraso(0.3)
+
+    inicio = time.perf_counter()
+    datos = asyncio.run(
+        descargar_estaciones(estaciones, lambda e: pd.read_csv(e["fuente"]), limite=limite)
+    )
+    segundos = time.perf_counter() - inicio
+
+    assert {k: int(df["valor"].iloc[0]) for k, df in datos.items()} == {f"e{i}": i for i in range(4)}
+    # Con 4 a la vez se tarda ~una descarga; de a una, la suma de las cuatro
+    assert minimo <= segundos < maximo
+
+
+def test_blobs_suben_antes_del_commit(github_falso):
+    url, repositorio = github_falso
+    repositorio.sembrar({"pronosticos/igual.json": "{}"})
+
+    async def publicar():
+        publicacion = PublicacionAsincrona(PublicadorGitHub("token", api=url, espera_base=0.0))
+        publicacion.enviar({"a.json": '{"a": 1}'})
+        publicacion.enviar({"igual.json": "{}"})
+        await asyncio.sleep(0.5)
+        # La subida de a.json ya terminó mientras "seguían los ajustes"
+        assert repositorio.contar("POST", "git/blobs") == 1
+        assert repositorio.contar("POST", "git/commits") == 0
+        publicacion.enviar({"index.json": '{"i": 1}'})
+        return await publicacion.terminar("pronósticos")
+
+    cambiados = asyncio.run(publicar())
+
+    assert sorted(cambiados) == ["a.json", "index.json"]
+    archivos = repositorio.archivos()
+    assert archivos["pronosticos/a.json"] == '{"a": 1}'
+    assert archivos["pronosticos/index.json"] == '{"i": 1}'
+    # igual.json no se sube; un solo árbol, commit y actualización de la rama
+    assert repositorio.contar("POST", "git/blobs") == 2
+    assert repositorio.contar("POST", "git/trees") == 1
+    assert repositorio.contar("POST", "git/commits") == 1
+    assert repositorio.contar("PATCH", "git/refs") == 1
+
+
+def test_consulta_fallida_sin_subidas_no_queda_pendiente(github_falso):
+    url, repositorio = github_falso
+    repositorio.fallos.append(("GET", "git/ref/heads", 404))
+
+    async def cancelar():
+        publicacion = PublicacionAsincrona(PublicadorGitHub("token", api=url, espera_base=0.0))
+        await publicacion.cancelar()
+        return publicacion.remotos
+
+    remotos = asyncio.run(cancelar())
+    assert remotos.done()
+
+
+def test_ejecucion_sube_mientras_ajusta(entorno_ejecucion, github_falso, monkeypatch):
+    """La primera subida llega antes de que termine la última búsqueda"""
+    from modelo_sarima import modelo as ms
+
+    url, repositorio = github_falso
+    monkeypatch.setenv("GH_TOKEN", "token")
+    monkeypatch.setenv("GITHUB_API_URL", url)
+    fin_busquedas = []
+    obtener_modelos = ms.obtener_modelos
+
+    def obtener_y_marcar(*args, **kwargs):
+        resultado = obtener_modelos(*args, **kwargs)
+        fin_busquedas.append(time.perf_counter())
+        return resultado
+
+    monkeypatch.setattr(ms, "obtener_modelos", obtener_y_marcar)
+
+    assert asyncio.run(ms.ejecutar()) == 0
+
+    assert len(fin_busquedas) == len(ms.VARIABLES)
+    assert min(repositorio.instantes("POST", "git/blobs")) < max(fin_busquedas)
+    assert repositorio.contar("POST", "git/commits") == 1
+    publicados = repositorio.archivos()
+    assert "pronosticos/index.json" in publicados
+    assert sum(r.startswith("pronosticos/pronostico_") for r in publicados) == len(ms.VARIABLES)
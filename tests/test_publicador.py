@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""PublicadorGitHub contra la Git Data API simulada en un servidor HTTP local"""
+
+import pytest
+
+pytest.importorskip("requests")
+
+from publicador import ErrorPublicacion, PublicadorGitHub, sha_blob  # noqa: E402
+
+ARCHIVOS = {f"pronostico_{i}.json": f'{{"v": {i}}}' for i in range(5)}
+ARCHIVOS["index.json"] = '{"archivos": 5}'
+
+
+@pytest.fixture
+def publicador(github_falso):
+    url, repositorio = github_falso
+    return PublicadorGitHub("token", api=url, espera_base=0.0), repositorio
+
+
+def test_un_solo_commit_por_publicacion(publicador):
+    publicador, repositorio = publicador
+
+    cambiados = publicador.publicar(ARCHIVOS, "pronósticos")
+
+    assert sorted(cambiados) == sorted(ARCHIVOS)
+    assert repositorio.contar("POST", "git/trees") == 1
+    assert repositorio.contar("POST", "git/commits") == 1
+    assert repositorio.contar("PATCH", "git/refs/heads/main") == 1
+    # El texto va dentro del árbol: no hace falta un blob por archivo
+    assert repositorio.contar("POST", "git/blobs") == 0
+    publicados = repositorio.archivos()
+    assert all(publicados[f"pronosticos/{n}"] == c for n, c in ARCHIVOS.items())
+    assert publicados["README.md"] == "# repo\n"
+
+
+def test_omite_archivos_sin_cambios(publicador):
+    publicador, repositorio = publicador
+    repositorio.sembrar({f"pronosticos/{n}": c for n, c in ARCHIVOS.items()})
+    commit_previo = repositorio.ref
+
+    assert publicador.publicar(ARCHIVOS, "sin cambios") == []
+    assert repositorio.ref == commit_previo
+    assert repositorio.contar("POST", "git/trees") == 0
+    assert repositorio.contar("POST", "git/commits") == 0
+
+    nuevos = {**ARCHIVOS, "index.json": '{"archivos": 6}'}
+    assert publicador.publicar(nuevos, "solo el índice") == ["index.json"]
+    assert repositorio.contar("POST", "git/commits") == 1
+    assert repositorio.archivos()["pronosticos/index.json"] == '{"archivos": 6}'
+
+
+def test_usa_blobs_subidos_antes(publicador):
+    publicador, repositorio = publicador
+    sha = publicador.subir_blob(ARCHIVOS["index.json"])
+    assert sha == sha_blob(ARCHIVOS["index.json"])
+
+    # Un blob que no corresponde al contenido actual se ignora
+    blobs = {"index.json": sha, "pronostico_0.json": sha}
+    assert sorted(publicador.publicar(ARCHIVOS, "con blobs", blobs)) == sorted(ARCHIVOS)
+    assert repositorio.archivos()["pronosticos/pronostico_0.json"] == ARCHIVOS["pronostico_0.json"]
+
+
+@pytest.mark.parametrize("fallos", [
+    [("GET", "git/ref/heads", 503)],
+    [("POST", "git/trees", 502), ("POST", "git/trees", 500)],
+    [("POST", "git/commits", 409)],
+    [("PATCH", "git/refs/heads", 500)],
+])
+def test_reintenta_ante_409_y_5xx(publicador, fallos):
+    publicador, repositorio = publicador
+    repositorio.fallos.extend(fallos)
+
+    assert sorted(publicador.publicar(ARCHIVOS, "con reintentos")) == sorted(ARCHIVOS)
+    assert repositorio.fallos == []
+    assert repositorio.contar("POST", "git/commits") == 1 + sum(m == "POST" and "commits" in r for m, r, _ in fallos)
+    assert all(repositorio.archivos()[f"pronosticos/{n}"] == c for n, c in ARCHIVOS.items())
+
+
+def test_rehace_el_commit_si_la_rama_avanzo(publicador):
+    publicador, repositorio = publicador
+    repositorio.fallos.append(("PATCH", "git/refs/heads", 422))
+
+    assert sorted(publicador.publicar(ARCHIVOS, "rama movida")) == sorted(ARCHIVOS)
+    assert repositorio.contar("POST", "git/commits") == 2
+    assert repositorio.contar("PATCH", "git/refs/heads") == 2
+
+
+def test_error_sin_reintento_o_agotados(github_falso):
+    url, repositorio = github_falso
+    publicador = PublicadorGitHub("token", api=url, espera_base=0.0, reintentos=1)
+
+    repositorio.fallos.append(("POST", "git/trees", 404))
+    with pytest.raises(ErrorPublicacion, match="404"):
+        publicador.publicar(ARCHIVOS, "no encontrado")
+    assert repositorio.contar("POST", "git/trees") == 1
+
+    repositorio.fallos.extend([("POST", "git/trees", 503)] * 2)
+    with pytest.raises(ErrorPublicacion, match="503"):
+        publicador.publicar(ARCHIVOS, "caído")
+    assert repositorio.contar("POST", "git/trees") == 3
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""serializar_json escribe lo mismo con orjson que con el módulo json"""
+
+import json
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("pandas")
+
+from modelo_sarima import modelo as ms  # noqa: E402
+
+DATOS = {
+    "valores": [1.5, float("nan"), float("inf")],
+    "arreglo": np.array([2.0, np.nan]),
+    "escalar": np.float64("nan"),
+    "entero": np.int64(3),
+    "anidado": {"t": (np.float32(0.5), None)},
+}
+ESPERADO = {
+    "valores": [1.5, None, None],
+    "arreglo": [2.0, None],
+    "escalar": None,
+    "entero": 3,
+    "anidado": {"t": [0.5, None]},
+}
+
+
+@pytest.mark.parametrize("compacto", [False, True])
+def test_nan_como_null_sin_orjson(monkeypatch, compacto):
+    monkeypatch.setattr(ms, "orjson", None)
+    contenido = ms.serializar_json(DATOS, compacto)
+    assert b"NaN" not in contenido and b"Infinity" not in contenido
+    assert json.loads(contenido) == ESPERADO
+
+
+@pytest.mark.parametrize("compacto", [False, True])
+def test_orjson_y_json_coinciden(monkeypatch, compacto):
+    if ms.orjson is None:
+        pytest.skip("orjson no instalado")
+    con_orjson = json.loads(ms.serializar_json(DATOS, compacto))
+    monkeypatch.setattr(ms, "orjson", None)
+    assert json.loads(ms.serializar_json(DATOS, compacto)) == con_orjson
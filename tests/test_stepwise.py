@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""Abandono temprano en stepwise: la heurística no debe cambiar el ganador"""
+
+import math
+
+import pytest
+
+pytest.importorskip("pandas")
+pytest.importorskip("statsmodels")
+
+from modelo_sarima import modelo as ms  # noqa: E402
+
+
+def _stepwise(serie):
+    estadisticas = {}
+    modelo, orden, orden_seas = ms.buscar_mejores_modelos(
+        {"serie": serie}, n_trabajadores=1, modo="stepwise", estadisticas=estadisticas
+    )["serie"][:3]
+    return (float(modelo.aic), orden, orden_seas), estadisticas["serie"]
+
+
+def test_mismo_ganador_con_y_sin_abandono(monkeypatch):
+    # Serie en la que el sondeo descarta un candidato con el margen por defecto
+    df0 = ms.generar_datos_ejemplo(243, fin="2026-01-01", semilla=1, ciclo_diario=1.0)
+    serie = ms.preparar_datos_horarios(df0)["Humidity"].dropna()
+
+    con_abandono, stats_con = _stepwise(serie)
+    monkeypatch.setattr(ms, "MARGEN_ABANDONO", math.inf)
+    sin_abandono, stats_sin = _stepwise(serie)
+
+    assert stats_con["abandonados"] >= 1 and stats_sin["abandonados"] == 0
+    assert con_abandono[1:] == sin_abandono[1:]
+    assert con_abandono[0] == pytest.approx(sin_abandono[0])
+
+    # Ajustados hasta el final, los descartados no le ganan al elegido
+    aic_completo = {
+        (tuple(d["orden"]), tuple(d["orden_estacional"])): d["aic"] for d in stats_sin["detalle"]
+    }
+    for d in stats_con["detalle"]:
+        if d["abandonado"]:
+            assert aic_completo[tuple(d["orden"]), tuple(d["orden_estacional"])] > con_abandono[0]
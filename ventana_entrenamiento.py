@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+"""Política de la ventana de entrenamiento: cuánto historial entra a cada ajuste
+
+El costo de un ajuste SARIMAX crece con el largo de la serie, así que el modelo
+horario nunca ve todo el historial acumulado:
+
+- ventana ``fija``: las últimas SARIMA_HORAS_VENTANA horas;
+- ventana ``adaptativa``: desde el último cambio de nivel de las medias diarias
+  (medido contra la última semana), entre SARIMA_VENTANA_MIN y SARIMA_VENTANA_MAX
+  horas.
+
+Con SARIMA_LARGO_PLAZO=1, un modelo pequeño sobre las medias diarias de hasta
+SARIMA_DIAS_LARGO_PLAZO días (``ComponenteLargoPlazo``) captura el nivel y la
+estacionalidad semanal. El modelo horario se ajusta sobre la desviación
+respecto de ese nivel, y el pronóstico final suma ambos, con sus varianzas.
+
+Las series cargadas se guardan en float32 (``AlmacenSeries``) y solo la ventana
+de cada ajuste pasa a float64. Así la memoria y el tiempo quedan acotados por
+la política y no por el tamaño del historial.
+"""
+
+import os
+import warnings
+
+import numpy as np
+import pandas as pd
+
+POLITICA_VENTANA = os.environ.get("SARIMA_VENTANA", "fija")
+
+# Ventana fija: ~1,463 lecturas crudas a razón de una cada 10 minutos
+HORAS_VENTANA = int(os.environ.get("SARIMA_HORAS_VENTANA", 1463 // 6))
+
+# Límites de la ventana adaptativa y umbral del cambio de nivel (desviaciones robustas)
+HORAS_VENTANA_MIN = int(os.environ.get("SARIMA_VENTANA_MIN", 7 * 24))
+HORAS_VENTANA_MAX = int(os.environ.get("SARIMA_VENTANA_MAX", 60 * 24))
+UMBRAL_CAMBIO_NIVEL = float(os.environ.get("SARIMA_UMBRAL_CAMBIO", 3.0))
+
+# Horas de historial que se exportan con cada pronóstico (de las ya cargadas)
+HORAS_HISTORICO = int(os.environ.get("SARIMA_HORAS_HISTORICO", 700))
+
+# Componente de largo plazo sobre medias diarias
+LARGO_PLAZO = os.environ.get("SARIMA_LARGO_PLAZO", "") == "1"
+DIAS_LARGO_PLAZO = int(os.environ.get("SARIMA_DIAS_LARGO_PLAZO", 365))
+MIN_DIAS_LARGO_PLAZO = 14
+# Horas con dato necesarias para que un día cuente en la media diaria
+MIN_HORAS_DIA = 12
+ORDEN_LARGO_PLAZO = (1, 0, 1)
+ORDEN_ESTACIONAL_LARGO_PLAZO = (1, 0, 0, 7)
+
+# Decimales al leer del almacén (quita el ruido de la conversión a float32)
+DECIMALES_ALMACEN = 4
+
+NS_POR_HORA = 3600 * 10**9
+MEDIODIA = pd.Timedelta(hours=12)
+
+
+class AlmacenSeries:
+    """Series horarias en float32, cada una acotada a sus últimas ``max_horas`` horas
+
+    Se guardan con paso horario fijo (fecha inicial + arreglo), así no hace falta
+    conservar el índice; las horas sin dato quedan como NaN y se descartan al leer.
+    """
+
+    def __init__(self, max_horas):
+        self.max_horas = max_horas
+        self._series = {}
+
+    def guardar(self, clave, serie):
+        if len(serie) == 0:
+            self._series[clave] = (0, np.empty(0, dtype=np.float32), serie.name)
+            return
+        serie = serie.asfreq("h")
+        serie = serie[serie.index > serie.index[-1] - pd.Timedelta(hours=self.max_horas)]
+        self._series[clave] = (
+            serie.index[0].as_unit("ns").value, serie.to_numpy(dtype=np.float32), serie.name
+        )
+
+    def serie(self, clave, horas=None):
+        """Serie en float64 (solo las últimas ``horas`` si se indican), sin horas vacías"""
+        inicio, valores, nombre = self._series[clave]
+        desde = 0 if horas is None else max(0, len(valores) - horas)
+        tramo = np.round(valores[desde:].astype(np.float64), DECIMALES_ALMACEN)
+        fechas = (inicio + (desde + np.arange(len(tramo), dtype=np.int64)) * NS_POR_HORA)
+        serie = pd.Series(tramo, index=pd.DatetimeIndex(fechas.view("datetime64[ns]"), name="date"),
+                          name=nombre)
+        return serie.dropna()
+
+    @property
+    def nbytes(self):
+        return sum(valores.nbytes for _, valores, _ in self._series.values())
+
+
+def medias_diarias(serie):
+    """Medias diarias (paso diario, NaN en los días con menos de MIN_HORAS_DIA horas)"""
+    remuestreo = serie.resample("D")
+    medias = remuestreo.mean()
+    return medias.where(remuestreo.count() >= MIN_HORAS_DIA).asfreq("D")
+
+
+class ComponenteLargoPlazo:
+    """Nivel diario (medias de cada día y su pronóstico) interpolado a horas
+
+    Cada media diaria se ubica al mediodía y el nivel de cada hora se interpola
+    entre mediodías; después de la última media observada siguen las del
+    pronóstico diario, cuya varianza se interpola igual.
+    """
+
+    def __init__(self, diarias, ajuste):
+        self.diarias = diarias.dropna()
+        self.ajuste = ajuste
+
+    def nivel(self, indice):
+        """Nivel diario en las horas de ``indice`` (solo medias observadas)"""
+        nudos = (self.diarias.index + MEDIODIA).as_unit("ns").asi8
+        return np.interp(indice.as_unit("ns").asi8, nudos, self.diarias.to_numpy())
+
+    def pronostico(self, indice):
+        """Media y varianza del nivel en las horas futuras de ``indice``"""
+        ultimo = self.diarias.index[-1]
+        # Un día más que el de la última hora, para interpolar hasta su final
+        dias = max(1, (indice[-1].floor("D") - ultimo).days + 1)
+        pred = self.ajuste.get_forecast(steps=dias)
+        futuro = pred.predicted_mean.index
+        nudos = np.concatenate([
+            (self.diarias.index + MEDIODIA).as_unit("ns").asi8,
+            (futuro + MEDIODIA).as_unit("ns").asi8,
+        ])
+        medias = np.concatenate([self.diarias.to_numpy(), np.asarray(pred.predicted_mean)])
+        varianzas = np.concatenate([np.zeros(len(self.diarias)), np.asarray(pred.se_mean) ** 2])
+        horas = indice.as_unit("ns").asi8
+        return np.interp(horas, nudos, medias), np.interp(horas, nudos, varianzas)
+
+
+def ajustar_largo_plazo(serie, dias=DIAS_LARGO_PLAZO, maxiter=200):
+    """Ajusta el modelo diario sobre las últimas ``dias`` medias (None si hay muy pocas)"""
+    from statsmodels.tsa.statespace.sarimax import SARIMAX
+
+    diarias = medias_diarias(serie)
+    diarias = diarias.loc[diarias.first_valid_index():diarias.last_valid_index()].tail(dias)
+    if diarias.count() < MIN_DIAS_LARGO_PLAZO:
+        return None
+    estacional = ORDEN_ESTACIONAL_LARGO_PLAZO if diarias.count() >= 4 * 7 else (0, 0, 0, 0)
+    # statsmodels antepone sus filtros al importarse: se silencian solo aquí
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        ajuste = SARIMAX(
+            diarias,
+            order=ORDEN_LARGO_PLAZO,
+            seasonal_order=estacional,
+            trend="c",
+            enforce_stationarity=False,
+            enforce_invertibility=False,
+        ).fit(disp=False, maxiter=maxiter)
+    return ComponenteLargoPlazo(diarias, ajuste)
+
+
+class PronosticoCombinado:
+    """Pronóstico horario más el nivel de largo plazo (misma interfaz que usa la exportación)"""
+
+    def __init__(self, pred, componente):
+        indice = pred.predicted_mean.index
+        media, varianza = componente.pronostico(indice)
+        self.predicted_mean = pred.predicted_mean + media
+        self.se_mean = pd.Series(
+            np.sqrt(np.asarray(pred.se_mean, dtype=float) ** 2 + varianza), index=indice
+        )
+
+
+class PoliticaVentana:
+    """Cuántas horas se cargan, cuántas entran al ajuste y si se separa el largo plazo"""
+
+    def __init__(self, tipo=POLITICA_VENTANA, horas=HORAS_VENTANA, minimo=HORAS_VENTANA_MIN,
+                 maximo=HORAS_VENTANA_MAX, umbral=UMBRAL_CAMBIO_NIVEL, historico=HORAS_HISTORICO,
+                 largo_plazo=LARGO_PLAZO, dias_largo_plazo=DIAS_LARGO_PLAZO):
+        if tipo not in ("fija", "adaptativa"):
+            raise ValueError(f"Ventana de entrenamiento desconocida: {tipo}")
+        self.tipo = tipo
+        self.horas = horas
+        self.minimo = minimo
+        self.maximo = maximo
+        self.umbral = umbral
+        self.historico = historico
+        self.largo_plazo = largo_plazo
+        self.dias_largo_plazo = dias_largo_plazo
+
+    def configuracion(self):
+        """Parámetros de la política (para la huella de la caché y las métricas)"""
+        return {
+            "tipo": self.tipo,
+            "horas": self.horas if self.tipo == "fija" else [self.minimo, self.maximo, self.umbral],
+            "largo_plazo": self.dias_largo_plazo if self.largo_plazo else None,
+        }
+
+    def horas_carga(self):
+        """Horas de historial que hay que leer para entrenar con esta política"""
+        horas = self.horas if self.tipo == "fija" else self.maximo
+        if self.largo_plazo:
+            horas = max(horas, self.dias_largo_plazo * 24)
+        return horas
+
+    def horas_entrenamiento(self, serie):
+        """Largo de la ventana del modelo horario para esta serie"""
+        if self.tipo == "fija":
+            return self.horas
+        diarias = medias_diarias(serie).dropna().tail(self.maximo // 24)
+        if len(diarias) < 2:
+            return self.maximo
+        referencia = diarias.tail(7)
+        mediana = referencia.median()
+        escala = 1.4826 * (referencia - mediana).abs().median()
+        if not escala > 0:
+            escala = diarias.std()
+        if not escala > 0:
+            return self.maximo
+        fuera = np.flatnonzero(np.abs(diarias.to_numpy() - mediana) > self.umbral * escala)
+        if len(fuera) == 0:
+            return self.maximo
+        dias_estables = len(diarias) - int(fuera[-1]) - 1
+        return int(min(self.maximo, max(self.minimo, dias_estables * 24)))
+
+    def preparar(self, serie):
+        """(serie del modelo horario, componente de largo plazo o None)
+
+        La serie sale recortada a la ventana y, con largo plazo, ya sin el nivel diario.
+        """
+        componente = ajustar_largo_plazo(serie, self.dias_largo_plazo) if self.largo_plazo else None
+        horas = self.horas_entrenamiento(serie)
+        corta = serie[serie.index > serie.index[-1] - pd.Timedelta(hours=horas)]
+        if componente is not None:
+            corta = corta - componente.nivel(corta.index)
+        return corta, componente